@@ -9,6 +9,12 @@ from datetime import time
 
 import pytest
 
+# Times shared by the net-hours tests, built once at import
+T_0800 = time(8, 0)
+T_0900 = time(9, 0)
+T_1400 = time(14, 0)
+T_1700 = time(17, 0)
+
 # --- Simplified implementations for testing ---
 
 
@@ -18,24 +24,11 @@ def round_time_employer_favor(t: time, is_check_in: bool) -> time:
     - Check-in: rounds UP (if 08:03 → 08:05)
     - Check-out: rounds DOWN (if 17:43 → 17:40)
     """
-    minute = t.minute
-    remainder = minute % 5
-
-    if remainder == 0:
-        return t
-
-    if is_check_in:
-        # Round up
-        new_minute = minute + (5 - remainder)
-        new_hour = t.hour
-        if new_minute >= 60:
-            new_minute -= 60
-            new_hour = (new_hour + 1) % 24
-        return time(new_hour, new_minute, 0)
-    else:
-        # Round down
-        new_minute = minute - remainder
-        return time(t.hour, new_minute, 0)
+    minutes = t.hour * 60 + t.minute
+    # Check-in adds 4 so the floor division rounds up instead of down
+    rounded = (minutes + (4 if is_check_in else 0)) // 5 * 5
+    hour, minute = divmod(rounded, 60)
+    return time(hour % 24, minute)
 
 
 def calculate_break_minutes(gross_hours: float) -> int:
@@ -88,109 +81,83 @@ def calculate_net_hours(
 class TestRoundTimeEmployerFavor:
     """Tests for round_time_employer_favor function."""
 
-    def test_check_in_rounds_up_from_03(self) -> None:
-        """Check-in at 08:03 rounds up to 08:05."""
-        result = round_time_employer_favor(time(8, 3), is_check_in=True)
-        assert result == time(8, 5)
-
-    def test_check_in_rounds_up_from_07(self) -> None:
-        """Check-in at 08:07 rounds up to 08:10."""
-        result = round_time_employer_favor(time(8, 7), is_check_in=True)
-        assert result == time(8, 10)
-
-    def test_check_in_exact_5_unchanged(self) -> None:
-        """Check-in at 08:05 stays at 08:05."""
-        result = round_time_employer_favor(time(8, 5), is_check_in=True)
-        assert result == time(8, 5)
-
-    def test_check_in_exact_0_unchanged(self) -> None:
-        """Check-in at 08:00 stays at 08:00."""
-        result = round_time_employer_favor(time(8, 0), is_check_in=True)
-        assert result == time(8, 0)
-
-    def test_check_out_rounds_down_from_43(self) -> None:
-        """Check-out at 17:43 rounds down to 17:40."""
-        result = round_time_employer_favor(time(17, 43), is_check_in=False)
-        assert result == time(17, 40)
-
-    def test_check_out_rounds_down_from_47(self) -> None:
-        """Check-out at 17:47 rounds down to 17:45."""
-        result = round_time_employer_favor(time(17, 47), is_check_in=False)
-        assert result == time(17, 45)
-
-    def test_check_out_exact_5_unchanged(self) -> None:
-        """Check-out at 17:45 stays at 17:45."""
-        result = round_time_employer_favor(time(17, 45), is_check_in=False)
-        assert result == time(17, 45)
-
-    def test_check_out_exact_0_unchanged(self) -> None:
-        """Check-out at 17:00 stays at 17:00."""
-        result = round_time_employer_favor(time(17, 0), is_check_in=False)
-        assert result == time(17, 0)
-
-    def test_check_in_at_01(self) -> None:
-        """Check-in at 08:01 rounds up to 08:05."""
-        result = round_time_employer_favor(time(8, 1), is_check_in=True)
-        assert result == time(8, 5)
-
-    def test_check_out_at_59(self) -> None:
-        """Check-out at 17:59 rounds down to 17:55."""
-        result = round_time_employer_favor(time(17, 59), is_check_in=False)
-        assert result == time(17, 55)
+    @pytest.mark.parametrize(
+        ("value", "is_check_in", "expected"),
+        [
+            (time(8, 3), True, time(8, 5)),
+            (time(8, 7), True, time(8, 10)),
+            (time(8, 5), True, time(8, 5)),
+            (time(8, 0), True, time(8, 0)),
+            (time(8, 1), True, time(8, 5)),
+            (time(17, 43), False, time(17, 40)),
+            (time(17, 47), False, time(17, 45)),
+            (time(17, 45), False, time(17, 45)),
+            (time(17, 0), False, time(17, 0)),
+            (time(17, 59), False, time(17, 55)),
+        ],
+        ids=[
+            "in-08:03",
+            "in-08:07",
+            "in-08:05-exact",
+            "in-08:00-exact",
+            "in-08:01",
+            "out-17:43",
+            "out-17:47",
+            "out-17:45-exact",
+            "out-17:00-exact",
+            "out-17:59",
+        ],
+    )
+    def test_rounds_in_employer_favor(
+        self, value: time, is_check_in: bool, expected: time
+    ) -> None:
+        """Check-in rounds up and check-out rounds down to 5 minutes."""
+        assert round_time_employer_favor(value, is_check_in) == expected
 
 
 class TestCalculateBreakMinutes:
     """Tests for calculate_break_minutes function."""
 
-    def test_over_6_hours_gets_30_min_break(self) -> None:
-        """Working over 6 hours requires 30 minute break."""
-        assert calculate_break_minutes(7.0) == 30
-        assert calculate_break_minutes(8.0) == 30
-        assert calculate_break_minutes(9.5) == 30
-
-    def test_exactly_6_hours_no_break(self) -> None:
-        """Working exactly 6 hours needs no break."""
-        assert calculate_break_minutes(6.0) == 0
-
-    def test_under_6_hours_no_break(self) -> None:
-        """Working under 6 hours needs no break."""
-        assert calculate_break_minutes(5.0) == 0
-        assert calculate_break_minutes(4.5) == 0
-        assert calculate_break_minutes(1.0) == 0
-
-    def test_just_over_6_hours_gets_break(self) -> None:
-        """Working just over 6 hours gets 30 min break."""
-        assert calculate_break_minutes(6.01) == 30
-        assert calculate_break_minutes(6.1) == 30
+    @pytest.mark.parametrize(
+        ("gross_hours", "expected"),
+        [
+            (7.0, 30),
+            (8.0, 30),
+            (9.5, 30),
+            (6.01, 30),
+            (6.1, 30),
+            (6.0, 0),
+            (5.0, 0),
+            (4.5, 0),
+            (1.0, 0),
+        ],
+    )
+    def test_break_required_only_over_6_hours(
+        self, gross_hours: float, expected: int
+    ) -> None:
+        """Working over 6 hours requires a 30 minute break, otherwise none."""
+        assert calculate_break_minutes(gross_hours) == expected
 
 
 class TestCalculateGrossHours:
     """Tests for calculate_gross_hours function."""
 
-    def test_standard_8_hour_day(self) -> None:
-        """8:00 to 17:00 is 9 gross hours."""
-        result = calculate_gross_hours(time(8, 0), time(17, 0))
-        assert result == 9.0
-
-    def test_8_30_to_17_30(self) -> None:
-        """8:30 to 17:30 is 9 gross hours."""
-        result = calculate_gross_hours(time(8, 30), time(17, 30))
-        assert result == 9.0
-
-    def test_short_day(self) -> None:
-        """9:00 to 12:00 is 3 gross hours."""
-        result = calculate_gross_hours(time(9, 0), time(12, 0))
-        assert result == 3.0
-
-    def test_with_minutes(self) -> None:
-        """8:15 to 16:45 is 8.5 gross hours."""
-        result = calculate_gross_hours(time(8, 15), time(16, 45))
-        assert result == 8.5
-
-    def test_overnight_shift(self) -> None:
-        """22:00 to 06:00 (overnight) is 8 gross hours."""
-        result = calculate_gross_hours(time(22, 0), time(6, 0))
-        assert result == 8.0
+    @pytest.mark.parametrize(
+        ("check_in", "check_out", "expected"),
+        [
+            (time(8, 0), time(17, 0), 9.0),
+            (time(8, 30), time(17, 30), 9.0),
+            (time(9, 0), time(12, 0), 3.0),
+            (time(8, 15), time(16, 45), 8.5),
+            (time(22, 0), time(6, 0), 8.0),
+        ],
+        ids=["standard-day", "half-past", "short-day", "with-minutes", "overnight"],
+    )
+    def test_gross_hours(
+        self, check_in: time, check_out: time, expected: float
+    ) -> None:
+        """Gross hours span check-in to check-out, across midnight if needed."""
+        assert calculate_gross_hours(check_in, check_out) == expected
 
 
 class TestCalculateNetHours:
@@ -198,37 +165,35 @@ class TestCalculateNetHours:
 
     def test_standard_day_with_auto_break(self) -> None:
         """8:00 to 17:00 = 9h gross, 30m auto break, 8.5h net."""
-        net, break_mins, gross = calculate_net_hours(time(8, 0), time(17, 0))
+        net, break_mins, gross = calculate_net_hours(T_0800, T_1700)
         assert gross == 9.0
         assert break_mins == 30
         assert net == 8.5
 
     def test_short_day_no_break(self) -> None:
         """9:00 to 14:00 = 5h gross, no break, 5h net."""
-        net, break_mins, gross = calculate_net_hours(time(9, 0), time(14, 0))
+        net, break_mins, gross = calculate_net_hours(T_0900, T_1400)
         assert gross == 5.0
         assert break_mins == 0
         assert net == 5.0
 
     def test_with_manual_break_override(self) -> None:
         """Manual break override of 45 minutes."""
-        net, break_mins, gross = calculate_net_hours(
-            time(8, 0), time(17, 0), break_override=45
-        )
+        net, break_mins, gross = calculate_net_hours(T_0800, T_1700, break_override=45)
         assert gross == 9.0
         assert break_mins == 45
         assert net == 8.25
 
     def test_exactly_6_hours_no_auto_break(self) -> None:
         """Exactly 6 hours = no automatic break."""
-        net, break_mins, gross = calculate_net_hours(time(8, 0), time(14, 0))
+        net, break_mins, gross = calculate_net_hours(T_0800, T_1400)
         assert gross == 6.0
         assert break_mins == 0
         assert net == 6.0
 
     def test_just_over_6_hours_gets_break(self) -> None:
         """Just over 6 hours = 30 min break."""
-        net, break_mins, gross = calculate_net_hours(time(8, 0), time(14, 5))
+        net, break_mins, gross = calculate_net_hours(T_0800, time(14, 5))
         assert gross == pytest.approx(6.083, rel=0.01)
         assert break_mins == 30
         assert net == pytest.approx(5.583, rel=0.01)
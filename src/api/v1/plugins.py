@@ -135,13 +135,13 @@ async def list_discovered_plugins(
     registered in the database yet.
     """
     loader = _get_loader()
-    discovered = loader.discover_plugins()
+    discovered = loader.discover_plugins_with_layout()
 
     # Get list of installed plugin IDs
     installed_ids = {config.plugin_id for config in db.query(PluginConfigModel).all()}
 
     plugins = []
-    for _plugin_path, manifest in discovered:
+    for _plugin_path, manifest, layout in discovered:
         if manifest.id not in installed_ids:
             plugins.append(
                 DiscoveredPlugin(
@@ -150,8 +150,8 @@ async def list_discovered_plugins(
                     version=manifest.version,
                     description=manifest.description,
                     author=manifest.author,
-                    has_frontend=loader.has_frontend(manifest.id),
-                    has_backend=loader.has_backend(manifest.id),
+                    has_frontend=layout.has_frontend,
+                    has_backend=layout.has_backend,
                 )
             )
 
@@ -183,13 +183,15 @@ async def install_discovered_plugin(
             detail=f"Plugin {plugin_id} is already installed",
         )
 
-    # Find the plugin in discovered list
-    discovered = loader.discover_plugins()
-    plugin_info = None
-    for plugin_path, manifest in discovered:
-        if manifest.id == plugin_id:
-            plugin_info = (plugin_path, manifest)
-            break
+    # Find the plugin on disk, parsing manifests only until it turns up
+    plugin_info = next(
+        (
+            (plugin_path, manifest)
+            for plugin_path, manifest in loader.iter_plugins()
+            if manifest.id == plugin_id
+        ),
+        None,
+    )
 
     if not plugin_info:
         raise HTTPException(
@@ -5,6 +5,7 @@
 import base64
 import hashlib
 import json
+from functools import lru_cache
 from typing import Any
 
 from cryptography.fernet import Fernet
@@ -12,12 +13,16 @@ from cryptography.fernet import Fernet
 from src.config import settings
 
 
+@lru_cache(maxsize=1)
+def _fernet_for(secret_key: str) -> Fernet:
+    """Build the Fernet instance for a secret key, deriving its key once."""
+    key = base64.urlsafe_b64encode(hashlib.sha256(secret_key.encode()).digest())
+    return Fernet(key)
+
+
 def get_fernet() -> Fernet:
     """Get Fernet instance using derived key from SECRET_KEY."""
-    key = base64.urlsafe_b64encode(
-        hashlib.sha256(settings.secret_key.encode()).digest()
-    )
-    return Fernet(key)
+    return _fernet_for(settings.secret_key)
 
 
 def encrypt_config(config: dict[str, Any]) -> str:
@@ -27,7 +32,8 @@ def encrypt_config(config: dict[str, Any]) -> str:
 
 def decrypt_config(encrypted: str) -> dict[str, Any]:
     """Decrypt a configuration string to a dictionary."""
-    return json.loads(get_fernet().decrypt(encrypted.encode()).decode())
+    # Fernet accepts the token as str and json parses the plaintext bytes
+    return json.loads(get_fernet().decrypt(encrypted))
 
 
 def encrypt_value(value: str) -> str:
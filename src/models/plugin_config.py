@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: GPL-2.0-only
 """Database models for plugin management."""
 
+import json
 import uuid as uuid_lib
 from typing import Any
 
@@ -73,6 +74,24 @@ class PluginConfigModel(Base, TimestampMixin):
         else:
             self.settings_encrypted = None
 
+    def get_granted_permissions(self) -> list[str]:
+        """Get the permission strings granted to the plugin.
+
+        Returns:
+            Granted permission strings, or empty list if none
+        """
+        if not self.permissions_granted:
+            return []
+        return json.loads(self.permissions_granted)
+
+    def set_granted_permissions(self, permissions: list[str]) -> None:
+        """Store the permission strings granted to the plugin.
+
+        Args:
+            permissions: Permission strings to store as a JSON array
+        """
+        self.permissions_granted = json.dumps(permissions) if permissions else None
+
 
 class PluginMigrationHistory(Base):
     """Track which migrations have been run for each plugin.
@@ -3,13 +3,17 @@
 """Event bus for plugin system communication."""
 
 import asyncio
+import inspect
+import itertools
 import logging
-from collections import defaultdict
-from collections.abc import Callable
+import sys
+import time
+from collections.abc import Callable, Iterable
+from contextvars import ContextVar
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import UTC, datetime, timedelta
 from enum import Enum
-from typing import Any
+from typing import Any, NamedTuple
 
 logger = logging.getLogger(__name__)
 
@@ -55,39 +59,163 @@ class AppEvent(str, Enum):
     PLUGIN_UNINSTALLED = "plugin.uninstalled"
 
 
-@dataclass
+# Plugin whose handler is currently running. Events published from inside a
+# handler are attributed to that plugin unless a source is given explicitly.
+_current_plugin: ContextVar[str | None] = ContextVar("current_plugin", default=None)
+
+# Position of each event in the EventBus subscriber tables
+_EVENT_INDEX: dict[AppEvent, int] = {event: i for i, event in enumerate(AppEvent)}
+
+# Events by string value. AppEvent is a str enum, so members hash and compare
+# equal to their values and resolve through the same table.
+_EVENTS_BY_VALUE: dict[str, AppEvent] = {event.value: event for event in AppEvent}
+
+# String value of each event, for logging without the Enum.value descriptor
+_EVENT_VALUE: dict[AppEvent, str] = {event: event.value for event in AppEvent}
+
+
+def _resolve_event(event_type: AppEvent | str) -> AppEvent:
+    """Return the AppEvent for a member or its string value.
+
+    Raises:
+        ValueError: If event_type is not a known event.
+    """
+    try:
+        return _EVENTS_BY_VALUE[event_type]
+    except KeyError:
+        raise ValueError(f"Unknown event type: {event_type!r}") from None
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+def _datetime_to_ns(timestamp: datetime) -> int:
+    """Convert a datetime to integer nanoseconds since the epoch.
+
+    Naive datetimes are taken to be UTC.
+    """
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=UTC)
+    delta = timestamp - _EPOCH
+    seconds = delta.days * 86_400 + delta.seconds
+    return seconds * 1_000_000_000 + delta.microseconds * 1_000
+
+
+@dataclass(init=False, slots=True, frozen=True)
 class EventPayload:
-    """Payload for an application event."""
+    """Payload for an application event.
+
+    The creation time is kept as integer nanoseconds since the epoch, which
+    is cheap to take on every publish. The ``timestamp`` datetime is only
+    built when a handler actually reads it. Payloads are frozen so the same
+    instance can be handed to every subscriber.
+    """
 
     event_type: AppEvent
-    timestamp: datetime
+    timestamp_ns: int
     data: dict[str, Any]
     source_plugin_id: str | None = None  # None means from host app
 
+    def __init__(
+        self,
+        event_type: AppEvent,
+        timestamp: datetime | None = None,
+        data: dict[str, Any] | None = None,
+        source_plugin_id: str | None = None,
+        *,
+        timestamp_ns: int | None = None,
+    ) -> None:
+        """Initialize the payload.
+
+        Args:
+            event_type: Type of event
+            timestamp: Event time (naive values are UTC); defaults to now
+            data: Event data payload
+            source_plugin_id: ID of plugin that generated event (None for host)
+            timestamp_ns: Event time in nanoseconds since the epoch, used
+                instead of ``timestamp`` on the publish fast path
+        """
+        if timestamp_ns is None:
+            timestamp_ns = (
+                time.time_ns() if timestamp is None else _datetime_to_ns(timestamp)
+            )
+        # Frozen dataclass: bypass __setattr__ like the generated __init__ does
+        object.__setattr__(self, "event_type", event_type)
+        object.__setattr__(self, "timestamp_ns", timestamp_ns)
+        object.__setattr__(self, "data", {} if data is None else data)
+        # Plugin IDs are a small closed set; intern them so payloads share one
+        # string per plugin and comparisons against subscriptions are cheap
+        if source_plugin_id is not None:
+            source_plugin_id = sys.intern(source_plugin_id)
+        object.__setattr__(self, "source_plugin_id", source_plugin_id)
+
+    @property
+    def timestamp(self) -> datetime:
+        """Event time as a timezone-aware UTC datetime."""
+        return _EPOCH + timedelta(microseconds=self.timestamp_ns // 1_000)
+
 
 # Type alias for event handlers
 EventHandler = Callable[[EventPayload], Any]
 
 
+class Subscription(NamedTuple):
+    """A handler subscribed to an event, as stored by the EventBus.
+
+    A tuple subclass without per-instance ``__dict__``: it costs the same as
+    a plain (plugin_id, handler) tuple and hashes and compares like one.
+    """
+
+    plugin_id: str | None
+    handler: EventHandler
+
+
 class EventBus:
     """Central event bus for application-wide events.
 
     Plugins can subscribe to events and receive notifications when
     actions occur in the application. Events are delivered asynchronously.
+    Event types may be given as AppEvent members or their string values
+    (e.g. "user.created"); unknown values raise ValueError. Events published
+    from inside a handler default to that handler's plugin as their source.
+
+    Handlers may subscribe and unsubscribe while an event is being
+    dispatched. Dispatch works on a snapshot of the subscribers, so such
+    changes take effect from the next publish on.
     """
 
     def __init__(self) -> None:
         """Initialize the event bus."""
-        self._handlers: dict[AppEvent, list[tuple[str | None, EventHandler]]] = (
-            defaultdict(list)
-        )
-        self._async_handlers: dict[
-            AppEvent, list[tuple[str | None, EventHandler]]
-        ] = defaultdict(list)
+        # AppEvent is a closed enum, so subscribers live in fixed-size tables
+        # indexed by _EVENT_INDEX rather than in dicts keyed by event. Each
+        # subscription gets a unique token; a slot maps tokens to the
+        # subscription and whether its handler is async, in subscription
+        # order. A handler subscribed twice is registered (and called) twice.
+        self._subscribers: list[dict[int, tuple[Subscription, bool]]] = [
+            {} for _ in AppEvent
+        ]
+        # Tokens of each subscription per slot, oldest first, so unsubscribing
+        # is a dict lookup instead of a list scan
+        self._tokens: list[dict[Subscription, list[int]]] = [{} for _ in AppEvent]
+        self._next_token = itertools.count()
+        # Immutable (sync, async) views of each slot for dispatch. Rebuilt on
+        # the first publish after a change, so publishing never copies and
+        # handlers may (un)subscribe while an event is being dispatched.
+        self._snapshots: list[
+            tuple[tuple[Subscription, ...], tuple[Subscription, ...]] | None
+        ] = [None] * len(AppEvent)
+        # Subscriber count per slot, kept in step with the tables
+        self._counts: list[int] = [0] * len(AppEvent)
+        # Strong references to fire-and-forget handler tasks (publish_nowait)
+        self._pending: set[asyncio.Task] = set()
+        # Reverse index so per-plugin teardown and lookups only touch the
+        # plugin's own subscriptions instead of scanning every event. A plain
+        # dict, so lookups for unknown plugins never create empty entries.
+        self._by_plugin: dict[str, set[tuple[AppEvent, EventHandler]]] = {}
 
     def subscribe(
         self,
-        event_type: AppEvent,
+        event_type: AppEvent | str,
         handler: EventHandler,
         plugin_id: str | None = None,
     ) -> None:
@@ -98,34 +226,60 @@ class EventBus:
             handler: Function to call when event fires (sync or async)
             plugin_id: ID of subscribing plugin (for tracking/unsubscribe)
         """
-        if asyncio.iscoroutinefunction(handler):
-            self._async_handlers[event_type].append((plugin_id, handler))
-        else:
-            self._handlers[event_type].append((plugin_id, handler))
+        if plugin_id is not None:
+            plugin_id = sys.intern(plugin_id)
+        event_type = _resolve_event(event_type)
+        index = _EVENT_INDEX[event_type]
+        entry = Subscription(plugin_id, handler)
+        token = next(self._next_token)
+        # Classify once here so publish never has to inspect handlers
+        self._subscribers[index][token] = (entry, inspect.iscoroutinefunction(handler))
+        self._tokens[index].setdefault(entry, []).append(token)
+        self._snapshots[index] = None
+        self._counts[index] += 1
+        if plugin_id is not None:
+            self._by_plugin.setdefault(plugin_id, set()).add((event_type, handler))
 
         logger.debug(
             f"Subscribed {'plugin ' + plugin_id if plugin_id else 'host'} "
-            f"to event {event_type.value}"
+            f"to event {_EVENT_VALUE[event_type]}"
         )
 
     def unsubscribe(
         self,
-        event_type: AppEvent,
+        event_type: AppEvent | str,
         handler: EventHandler,
         plugin_id: str | None = None,
     ) -> None:
         """Unsubscribe from an event.
 
+        Removes one subscription of the handler, the oldest, if it was
+        subscribed more than once.
+
         Args:
             event_type: Event type to unsubscribe from
             handler: Handler function to remove
             plugin_id: Plugin ID that subscribed
         """
+        event_type = _resolve_event(event_type)
+        index = _EVENT_INDEX[event_type]
         entry = (plugin_id, handler)
-        if entry in self._handlers[event_type]:
-            self._handlers[event_type].remove(entry)
-        if entry in self._async_handlers[event_type]:
-            self._async_handlers[event_type].remove(entry)
+        tokens = self._tokens[index].get(entry)
+        if not tokens:
+            return
+        del self._subscribers[index][tokens.pop(0)]
+        self._snapshots[index] = None
+        self._counts[index] -= 1
+        if tokens:
+            return
+        del self._tokens[index][entry]
+
+        if plugin_id is not None:
+            subscriptions = self._by_plugin.get(plugin_id)
+            if subscriptions is not None:
+                subscriptions.discard((event_type, handler))
+                if not subscriptions:
+                    del self._by_plugin[plugin_id]
 
     def unsubscribe_plugin(self, plugin_id: str) -> None:
         """Remove all handlers for a plugin.
@@ -133,64 +287,124 @@ class EventBus:
         Args:
             plugin_id: Plugin ID whose handlers should be removed
         """
-        for event_type in list(self._handlers.keys()):
-            self._handlers[event_type] = [
-                (pid, handler)
-                for pid, handler in self._handlers[event_type]
-                if pid != plugin_id
-            ]
-        for event_type in list(self._async_handlers.keys()):
-            self._async_handlers[event_type] = [
-                (pid, handler)
-                for pid, handler in self._async_handlers[event_type]
-                if pid != plugin_id
-            ]
+        for event_type, handler in self._by_plugin.pop(plugin_id, ()):
+            index = _EVENT_INDEX[event_type]
+            tokens = self._tokens[index].pop((plugin_id, handler), ())
+            for token in tokens:
+                del self._subscribers[index][token]
+            if tokens:
+                self._snapshots[index] = None
+                self._counts[index] -= len(tokens)
 
         logger.debug(f"Unsubscribed all handlers for plugin {plugin_id}")
 
+    def _snapshot(
+        self, index: int
+    ) -> tuple[tuple[Subscription, ...], tuple[Subscription, ...]]:
+        """Return the (sync, async) subscriber tuples for a table slot."""
+        snapshot = self._snapshots[index]
+        if snapshot is None:
+            subscribers = self._subscribers[index].values()
+            snapshot = self._snapshots[index] = (
+                tuple(entry for entry, is_async in subscribers if not is_async),
+                tuple(entry for entry, is_async in subscribers if is_async),
+            )
+        return snapshot
+
     async def publish(
         self,
-        event_type: AppEvent,
+        event_type: AppEvent | str,
         data: dict[str, Any],
         source_plugin_id: str | None = None,
     ) -> None:
         """Publish an event to all subscribers.
 
+        Nothing is built or dispatched when the event has no subscribers.
+
         Args:
             event_type: Type of event
             data: Event data payload
             source_plugin_id: ID of plugin that generated event (None for host)
         """
+        event_type = _resolve_event(event_type)
+        index = _EVENT_INDEX[event_type]
+        if not self._counts[index]:
+            return
+
+        if source_plugin_id is None:
+            source_plugin_id = _current_plugin.get()
         payload = EventPayload(
             event_type=event_type,
-            timestamp=datetime.utcnow(),
+            timestamp_ns=time.time_ns(),
             data=data,
             source_plugin_id=source_plugin_id,
         )
-
-        # Call sync handlers
-        for plugin_id, handler in self._handlers.get(event_type, []):
-            try:
-                handler(payload)
-            except Exception as e:
-                logger.error(
-                    f"Error in sync event handler for {event_type.value} "
-                    f"(plugin: {plugin_id}): {e}"
+        handlers, async_handlers = self._snapshot(index)
+        self._call_sync_handlers(handlers, payload)
+
+        # Sync-only subscribers never touch the event loop. A lone async
+        # handler is awaited directly, skipping the task gather() would wrap
+        # it in; several run concurrently and one failure can't stop others.
+        if len(async_handlers) == 1:
+            plugin_id, handler = async_handlers[0]
+            await self._run_async_handler(plugin_id, handler, payload)
+        elif async_handlers:
+            await asyncio.gather(
+                *(
+                    self._run_async_handler(plugin_id, handler, payload)
+                    for plugin_id, handler in async_handlers
                 )
+            )
 
-        # Call async handlers
-        for plugin_id, handler in self._async_handlers.get(event_type, []):
-            try:
-                await handler(payload)
-            except Exception as e:
-                logger.error(
-                    f"Error in async event handler for {event_type.value} "
-                    f"(plugin: {plugin_id}): {e}"
+    async def publish_many(
+        self,
+        events: Iterable[tuple[AppEvent | str, dict[str, Any]]],
+        source_plugin_id: str | None = None,
+    ) -> None:
+        """Publish a batch of events to all subscribers.
+
+        All payloads in the batch share one timestamp and subscribers are
+        looked up once per distinct event type. Sync handlers run as each
+        payload is built; async handlers for the whole batch are awaited
+        together. Within an event type, payloads keep their input order.
+
+        Args:
+            events: (event_type, data) pairs to publish; event types may be
+                AppEvent members or their string values
+            source_plugin_id: ID of plugin that generated events (None for host)
+        """
+        by_event: dict[AppEvent, list[dict[str, Any]]] = {}
+        for event_type, data in events:
+            by_event.setdefault(_resolve_event(event_type), []).append(data)
+
+        if source_plugin_id is None:
+            source_plugin_id = _current_plugin.get()
+        timestamp_ns = time.time_ns()
+        calls = []
+        for event_type, batch in by_event.items():
+            index = _EVENT_INDEX[event_type]
+            if not self._counts[index]:
+                continue
+            handlers, async_handlers = self._snapshot(index)
+            for data in batch:
+                payload = EventPayload(
+                    event_type=event_type,
+                    timestamp_ns=timestamp_ns,
+                    data=data,
+                    source_plugin_id=source_plugin_id,
                 )
+                self._call_sync_handlers(handlers, payload)
+                calls.extend(
+                    self._run_async_handler(plugin_id, handler, payload)
+                    for plugin_id, handler in async_handlers
+                )
+
+        if calls:
+            await asyncio.gather(*calls)
 
     def publish_sync(
         self,
-        event_type: AppEvent,
+        event_type: AppEvent | str,
         data: dict[str, Any],
         source_plugin_id: str | None = None,
     ) -> None:
@@ -204,30 +418,105 @@ class EventBus:
             data: Event data payload
             source_plugin_id: ID of plugin that generated event
         """
+        event_type = _resolve_event(event_type)
+        index = _EVENT_INDEX[event_type]
+        if not self._counts[index]:
+            return
+
+        if source_plugin_id is None:
+            source_plugin_id = _current_plugin.get()
         payload = EventPayload(
             event_type=event_type,
-            timestamp=datetime.utcnow(),
+            timestamp_ns=time.time_ns(),
             data=data,
             source_plugin_id=source_plugin_id,
         )
+        handlers, async_handlers = self._snapshot(index)
+        self._call_sync_handlers(handlers, payload)
+
+        # Log warning if async handlers exist but weren't called
+        if async_handlers:
+            logger.warning(
+                f"Event {_EVENT_VALUE[event_type]} has async handlers that were "
+                "not called due to sync publish"
+            )
 
-        for plugin_id, handler in self._handlers.get(event_type, []):
+    def publish_nowait(
+        self,
+        event_type: AppEvent | str,
+        data: dict[str, Any],
+        source_plugin_id: str | None = None,
+    ) -> None:
+        """Publish an event without waiting for async handlers to finish.
+
+        Sync handlers run immediately; async handlers are scheduled as tasks
+        on the running event loop and the call returns right away. Errors in
+        those tasks are logged like in publish().
+
+        Args:
+            event_type: Type of event
+            data: Event data payload
+            source_plugin_id: ID of plugin that generated event (None for host)
+
+        Raises:
+            RuntimeError: If called without a running event loop.
+        """
+        loop = asyncio.get_running_loop()
+        event_type = _resolve_event(event_type)
+        index = _EVENT_INDEX[event_type]
+        if not self._counts[index]:
+            return
+
+        if source_plugin_id is None:
+            source_plugin_id = _current_plugin.get()
+        payload = EventPayload(
+            event_type=event_type,
+            timestamp_ns=time.time_ns(),
+            data=data,
+            source_plugin_id=source_plugin_id,
+        )
+        handlers, async_handlers = self._snapshot(index)
+        self._call_sync_handlers(handlers, payload)
+
+        for plugin_id, handler in async_handlers:
+            task = loop.create_task(
+                self._run_async_handler(plugin_id, handler, payload)
+            )
+            self._pending.add(task)
+            task.add_done_callback(self._pending.discard)
+
+    def _call_sync_handlers(
+        self, handlers: tuple[Subscription, ...], payload: EventPayload
+    ) -> None:
+        """Call sync handlers in order, logging instead of raising errors."""
+        for plugin_id, handler in handlers:
+            token = _current_plugin.set(plugin_id)
             try:
                 handler(payload)
             except Exception as e:
                 logger.error(
-                    f"Error in sync event handler for {event_type.value} "
-                    f"(plugin: {plugin_id}): {e}"
+                    "Error in sync event handler for "
+                    f"{_EVENT_VALUE[payload.event_type]} (plugin: {plugin_id}): {e}"
                 )
+            finally:
+                _current_plugin.reset(token)
 
-        # Log warning if async handlers exist but weren't called
-        if self._async_handlers.get(event_type):
-            logger.warning(
-                f"Event {event_type.value} has async handlers that were "
-                "not called due to sync publish"
+    async def _run_async_handler(
+        self, plugin_id: str | None, handler: EventHandler, payload: EventPayload
+    ) -> None:
+        """Await a single async handler, logging instead of raising errors."""
+        token = _current_plugin.set(plugin_id)
+        try:
+            await handler(payload)
+        except Exception as e:
+            logger.error(
+                "Error in async event handler for "
+                f"{_EVENT_VALUE[payload.event_type]} (plugin: {plugin_id}): {e}"
             )
+        finally:
+            _current_plugin.reset(token)
 
-    def get_subscriber_count(self, event_type: AppEvent) -> int:
+    def get_subscriber_count(self, event_type: AppEvent | str) -> int:
         """Get the number of subscribers for an event type.
 
         Args:
@@ -236,9 +525,7 @@ class EventBus:
         Returns:
             Number of subscribers
         """
-        sync_count = len(self._handlers.get(event_type, []))
-        async_count = len(self._async_handlers.get(event_type, []))
-        return sync_count + async_count
+        return self._counts[_EVENT_INDEX[_resolve_event(event_type)]]
 
     def get_subscribed_events(self, plugin_id: str) -> list[AppEvent]:
         """Get all events a plugin is subscribed to.
@@ -249,14 +536,9 @@ class EventBus:
         Returns:
             List of event types the plugin is subscribed to
         """
-        events = set()
-        for event_type, handlers in self._handlers.items():
-            if any(pid == plugin_id for pid, _ in handlers):
-                events.add(event_type)
-        for event_type, handlers in self._async_handlers.items():
-            if any(pid == plugin_id for pid, _ in handlers):
-                events.add(event_type)
-        return list(events)
+        return list(
+            {event_type for event_type, _ in self._by_plugin.get(plugin_id, ())}
+        )
 
 
 # Global event bus singleton
@@ -2,17 +2,23 @@
 # SPDX-License-Identifier: GPL-2.0-only
 """Plugin discovery, loading, and management."""
 
+import copy
 import importlib.util
 import json
 import logging
+import os
 import re
 import shutil
 import subprocess
 import sys
+import time
 import zipfile
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from functools import lru_cache
 from pathlib import Path
-from tempfile import TemporaryDirectory
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 from src.plugins.base import (
     BasePlugin,
@@ -24,6 +30,17 @@ from src.plugins.base import (
 )
 from src.plugins.permissions import PermissionChecker
 
+try:
+    from orjson import dumps as _json_dumps
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is optional; stdlib json accepts bytes too
+    from json import loads as _json_loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        """Encode obj as UTF-8 JSON bytes, like orjson.dumps."""
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+
 if TYPE_CHECKING:
     from sqlalchemy.orm import Session
 
@@ -32,6 +49,12 @@ logger = logging.getLogger(__name__)
 # Default plugins directory relative to project root
 PLUGINS_DIR = Path("./plugins")
 PLUGIN_MANIFEST_FILE = "plugin.manifest.json"
+# Entry points whose presence marks a plugin as having a frontend/backend
+FRONTEND_ENTRY = "frontend/index.js"
+BACKEND_ENTRY = "backend/plugin.py"
+# Decoded manifests from the last scan, so a cold start can skip re-reading
+# unchanged ones. Lives in a hidden directory, which discovery ignores.
+PLUGIN_INDEX_FILE = ".cache/index.json"
 
 # Regex for validating pip requirement specifiers (PEP 508 simplified)
 # Matches: package, package>=1.0, package[extra]>=1.0,<2.0, etc.
@@ -42,6 +65,40 @@ DEPENDENCY_PATTERN = re.compile(
     r"([<>=!~]+[\d.]+(\s*,\s*[<>=!~]+[\d.]+)*)?$"  # Version specifiers
 )
 
+# Plugin IDs: alphanumerics, hyphens and underscores. \w is str.isalnum()
+# plus underscore, so Unicode letters and digits stay valid as before.
+PLUGIN_ID_PATTERN = re.compile(r"[\w-]+")
+
+# Value -> member table for manifest capabilities (unknown names are skipped)
+_CAPABILITIES_BY_VALUE: dict[str, PluginCapability] = {
+    c.value: c for c in PluginCapability
+}
+
+# Manifest fields every plugin must define, in the order they are reported
+_REQUIRED_FIELD_ORDER = ("id", "name", "version", "description")
+_REQUIRED_FIELDS = frozenset(_REQUIRED_FIELD_ORDER)
+
+# Manifests modified this recently are parsed without caching: a rewrite of
+# the same size within the filesystem's timestamp granularity would otherwise
+# be indistinguishable from the cached version (2s covers FAT/SMB mounts)
+MANIFEST_CACHE_MIN_AGE_NS = 2_000_000_000
+
+# Upper bound on threads reading manifests during discovery
+MAX_DISCOVERY_WORKERS = 8
+
+
+class PluginLayout(NamedTuple):
+    """Which optional parts a plugin directory ships."""
+
+    has_frontend: bool
+    has_backend: bool
+
+
+# A discovery reader's change to the manifest index: (plugin directory name,
+# new entry), or (name, None) to drop the entry. Readers run on worker
+# threads, so they return changes instead of writing to the shared index.
+_IndexUpdate = tuple[str, dict[str, Any] | None]
+
 
 class PluginLoadError(Exception):
     """Error loading a plugin module."""
@@ -55,9 +112,14 @@ class PluginValidationError(Exception):
     pass
 
 
-def parse_manifest(manifest_path: Path) -> PluginManifest:
+def parse_manifest(manifest_path: Path | str) -> PluginManifest:
     """Parse and validate a plugin manifest file.
 
+    Results are cached by path, modification time and size, so repeated
+    lookups (API requests, upgrade version checks) skip reading and parsing
+    unchanged manifests. Discovery uses the persistent manifest index instead.
+    Each call returns its own copy, so callers may modify the result.
+
     Args:
         manifest_path: Path to the manifest JSON file
 
@@ -67,25 +129,80 @@ def parse_manifest(manifest_path: Path) -> PluginManifest:
     Raises:
         PluginValidationError: If manifest is invalid
     """
+    path = os.fspath(manifest_path)
     try:
-        with open(manifest_path, encoding="utf-8") as f:
-            data = json.load(f)
-    except json.JSONDecodeError as e:
-        raise PluginValidationError(f"Invalid JSON in manifest: {e}") from e
+        stat = os.stat(path)
     except OSError as e:
         raise PluginValidationError(f"Could not read manifest: {e}") from e
 
+    if time.time_ns() - stat.st_mtime_ns < MANIFEST_CACHE_MIN_AGE_NS:
+        return _parse_manifest_file(path)
+    return _copy_manifest(_parse_manifest_cached(path, stat.st_mtime_ns, stat.st_size))
+
+
+@lru_cache(maxsize=512)
+def _parse_manifest_cached(path: str, mtime_ns: int, size: int) -> PluginManifest:
+    """Parse a manifest, memoized on its path and stat signature.
+
+    The cached instance is never handed out; see _copy_manifest.
+    """
+    return _parse_manifest_file(path)
+
+
+def _copy_manifest(manifest: PluginManifest) -> PluginManifest:
+    """Copy a manifest deeply enough that changes never reach the original.
+
+    Only the containers and ProvidedPermission entries are mutable; every
+    other field is a str, enum member or None and can be shared.
+    """
+    return replace(
+        manifest,
+        capabilities=set(manifest.capabilities),
+        required_permissions=set(manifest.required_permissions),
+        provided_permissions=[replace(p) for p in manifest.provided_permissions],
+        dependencies=list(manifest.dependencies),
+        python_dependencies=list(manifest.python_dependencies),
+    )
+
+
+def _parse_manifest_file(path: str) -> PluginManifest:
+    """Read, parse and validate a manifest file without caching."""
+    try:
+        with open(path, "rb") as f:
+            raw = f.read()
+    except OSError as e:
+        raise PluginValidationError(f"Could not read manifest: {e}") from e
+    return _parse_manifest_bytes(raw)
+
+
+def _parse_manifest_bytes(raw: bytes) -> PluginManifest:
+    """Parse and validate raw manifest JSON."""
+    return _manifest_from_data(_decode_manifest(raw))
+
+
+def _decode_manifest(raw: bytes) -> dict[str, Any]:
+    """Decode raw manifest JSON without validating it."""
+    try:
+        # Decode straight from bytes; orjson.JSONDecodeError subclasses the
+        # stdlib exception, so one handler covers both parsers
+        return _json_loads(raw)
+    except json.JSONDecodeError as e:
+        raise PluginValidationError(f"Invalid JSON in manifest: {e}") from e
+
+
+def _manifest_from_data(data: dict[str, Any]) -> PluginManifest:
+    """Validate decoded manifest data and build the manifest."""
     # Validate required fields
-    required_fields = ["id", "name", "version", "description"]
-    for field in required_fields:
-        if field not in data:
-            raise PluginValidationError(f"Missing required field: {field}")
+    missing = _REQUIRED_FIELDS.difference(data)
+    if missing:
+        field = next(f for f in _REQUIRED_FIELD_ORDER if f in missing)
+        raise PluginValidationError(f"Missing required field: {field}")
 
     # Validate plugin ID format (alphanumeric, hyphens, underscores)
     plugin_id = data["id"]
     if not plugin_id:
         raise PluginValidationError("Plugin ID cannot be empty")
-    if not all(c.isalnum() or c in "-_" for c in plugin_id):
+    if not PLUGIN_ID_PATTERN.fullmatch(plugin_id):
         raise PluginValidationError(
             f"Invalid plugin ID: {plugin_id}. "
             "Use only alphanumeric characters, hyphens, and underscores."
@@ -97,19 +214,21 @@ def parse_manifest(manifest_path: Path) -> PluginManifest:
 
     if isinstance(caps_data, dict):
         # Handle object format: {"backend": true, "frontend": true}
-        for cap_name, enabled in caps_data.items():
-            if enabled:
-                try:
-                    capabilities.add(PluginCapability(cap_name))
-                except ValueError:
-                    logger.warning(f"Unknown capability: {cap_name}")
+        cap_names = [name for name, enabled in caps_data.items() if enabled]
     elif isinstance(caps_data, list):
         # Handle array format: ["backend", "frontend"]
-        for cap_name in caps_data:
-            try:
-                capabilities.add(PluginCapability(cap_name))
-            except ValueError:
-                logger.warning(f"Unknown capability: {cap_name}")
+        cap_names = caps_data
+    else:
+        cap_names = []
+
+    for cap_name in cap_names:
+        capability = (
+            _CAPABILITIES_BY_VALUE.get(cap_name) if isinstance(cap_name, str) else None
+        )
+        if capability is None:
+            logger.warning(f"Unknown capability: {cap_name}")
+        else:
+            capabilities.add(capability)
 
     # Parse permissions - support both old and new formats
     required_permissions: set[Permission] = set()
@@ -316,6 +435,64 @@ def load_plugin_class(
     return plugin_class
 
 
+def _find_manifest_prefix(infos: list[zipfile.ZipInfo]) -> str | None:
+    """Locate the plugin manifest inside a ZIP archive listing.
+
+    The manifest is either at the archive root or inside a single top-level
+    (non-hidden) directory.
+
+    Args:
+        infos: Archive members from ZipFile.infolist()
+
+    Returns:
+        Member name prefix of the plugin root ("" for the archive root), or
+        None if no manifest was found
+    """
+    names = {info.filename for info in infos}
+    if PLUGIN_MANIFEST_FILE in names:
+        return ""
+
+    top_dirs = {
+        name.split("/", 1)[0]
+        for name in names
+        if "/" in name and not name.startswith(".")
+    }
+    if len(top_dirs) == 1:
+        prefix = f"{top_dirs.pop()}/"
+        if prefix + PLUGIN_MANIFEST_FILE in names:
+            return prefix
+    return None
+
+
+def _extract_members(
+    zf: zipfile.ZipFile,
+    infos: list[zipfile.ZipInfo],
+    prefix: str,
+    target_dir: Path,
+) -> None:
+    """Extract the archive members under prefix into target_dir.
+
+    The prefix is stripped from member names. Absolute paths and ".."
+    components are neutralised by ZipFile.extract as usual.
+
+    Args:
+        zf: Open archive
+        infos: Archive members from ZipFile.infolist()
+        prefix: Member name prefix of the plugin root
+        target_dir: Directory to extract into (created if missing)
+    """
+    target_dir.mkdir(parents=True)
+    for info in infos:
+        if not info.filename.startswith(prefix) or info.filename == prefix:
+            continue
+        if prefix:
+            # Extract under the stripped name without touching the archive's
+            # own ZipInfo (reading uses header_offset, not the name)
+            info = copy.copy(info)
+            info.filename = info.filename[len(prefix) :]
+        zf.extract(info, target_dir)
+
+
 class PluginLoader:
     """Handles plugin discovery, loading, and installation."""
 
@@ -327,40 +504,265 @@ class PluginLoader:
         """
         self.plugins_dir = plugins_dir or PLUGINS_DIR
         self.plugins_dir.mkdir(parents=True, exist_ok=True)
+        # Plugin directory name -> {"mtime_ns", "size", "manifest"}; loaded
+        # from PLUGIN_INDEX_FILE on first discovery
+        self._index: dict[str, dict[str, Any]] | None = None
+        self._index_dirty = False
 
     def discover_plugins(self) -> list[tuple[Path, PluginManifest]]:
         """Discover all plugins in the plugins directory.
 
+        Manifests are read in parallel on a small thread pool, since reading
+        them is I/O bound. Results are ordered by directory name.
+
         Returns:
             List of tuples (plugin_path, manifest) for each valid plugin
         """
-        discovered: list[tuple[Path, PluginManifest]] = []
+        return self._discover(self._read_manifest)
+
+    def discover_plugins_with_layout(
+        self,
+    ) -> list[tuple[Path, PluginManifest, PluginLayout]]:
+        """Discover all plugins along with their frontend/backend layout.
+
+        Equivalent to discover_plugins() followed by has_frontend() and
+        has_backend() per plugin, but the layout checks run on the discovery
+        thread pool in the same task that reads each manifest.
+
+        Returns:
+            List of tuples (plugin_path, manifest, layout) for each valid plugin
+        """
+        return [
+            (path, manifest, layout)
+            for path, (manifest, layout) in self._discover(
+                self._read_manifest_and_layout
+            )
+        ]
+
+    def iter_plugins(self) -> Iterator[tuple[Path, PluginManifest]]:
+        """Lazily discover plugins, one manifest at a time.
+
+        Unlike discover_plugins(), manifests are parsed serially and only as
+        far as the caller iterates, so a search can stop at the first match.
+
+        Yields:
+            Tuples (plugin_path, manifest) for each valid plugin, ordered by
+            directory name
+        """
+        candidates = self._candidate_dirs()
+        for plugin_dir in candidates:
+            manifest, update = self._read_manifest(plugin_dir)
+            self._apply_index_update(update)
+            if manifest is not None:
+                yield Path(plugin_dir), manifest
+        self._save_index(candidates)
+
+    def _discover[T](
+        self, reader: Callable[[str], tuple[T | None, _IndexUpdate | None]]
+    ) -> list[tuple[Path, T]]:
+        """Apply reader to every candidate plugin directory.
+
+        Readers only read the manifest index; the changes they return are
+        applied here on the calling thread once all of them have finished.
+
+        Args:
+            reader: Called with each plugin directory; returns the result
+                (None to skip the directory) and any index change
+
+        Returns:
+            List of (plugin_path, result) pairs ordered by directory name
+        """
+        candidates = self._candidate_dirs()
+        if len(candidates) > 1:
+            workers = min(MAX_DISCOVERY_WORKERS, len(candidates))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                outcomes = list(executor.map(reader, candidates))
+        else:
+            outcomes = [reader(path) for path in candidates]
+        for _, update in outcomes:
+            self._apply_index_update(update)
+        self._save_index(candidates)
+
+        return [
+            (Path(plugin_dir), result)
+            for plugin_dir, (result, _) in zip(candidates, outcomes, strict=True)
+            if result is not None
+        ]
+
+    def _candidate_dirs(self) -> list[str]:
+        """List directories in the plugins directory that may hold a plugin.
+
+        Returns:
+            Non-hidden subdirectories other than __pycache__, sorted by name
+        """
         logger.debug(f"Discovering plugins in {self.plugins_dir}")
+        self._load_index()
+
+        # One readdir pass: DirEntry.is_dir() answers from the cached dirent
+        # type, and the manifest stat doubles as the existence check.
+        # Paths stay plain strings until returned to avoid per-plugin Path
+        # construction in the hot loop.
+        try:
+            scanner = os.scandir(self.plugins_dir)
+        except FileNotFoundError:
+            return []
+
+        with scanner:
+            return sorted(
+                entry.path
+                for entry in scanner
+                # Skip hidden directories and __pycache__
+                if not entry.name.startswith(".")
+                and entry.name != "__pycache__"
+                and entry.is_dir()
+            )
 
-        if not self.plugins_dir.exists():
-            return discovered
+    def _load_index(self) -> None:
+        """Load the on-disk manifest index once; a bad index starts empty."""
+        if self._index is not None:
+            return
+        try:
+            with open(self.plugins_dir / PLUGIN_INDEX_FILE, "rb") as f:
+                index = _json_loads(f.read())
+        except FileNotFoundError:
+            index = {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable plugin index: {e}")
+            index = {}
+        self._index = index if isinstance(index, dict) else {}
+
+    def _apply_index_update(self, update: _IndexUpdate | None) -> None:
+        """Record an index change returned by a discovery reader.
 
-        for entry in self.plugins_dir.iterdir():
-            if not entry.is_dir():
-                continue
+        Args:
+            update: The change, or None if the reader left the index as is
+        """
+        if update is None or self._index is None:
+            return
+        name, entry = update
+        if entry is not None:
+            self._index[name] = entry
+        elif self._index.pop(name, None) is None:
+            return
+        self._index_dirty = True
+
+    def _save_index(self, candidates: list[str]) -> None:
+        """Persist the manifest index if this scan changed it.
+
+        Args:
+            candidates: Plugin directories seen by the scan; entries for any
+                other directory are dropped
+        """
+        index = self._index
+        if index is None:
+            return
+        seen = {os.path.basename(plugin_dir) for plugin_dir in candidates}
+        for name in index.keys() - seen:
+            del index[name]
+            self._index_dirty = True
+        if not self._index_dirty:
+            return
+
+        index_path = self.plugins_dir / PLUGIN_INDEX_FILE
+        tmp_path = index_path.with_name(f"{index_path.name}.tmp")
+        try:
+            index_path.parent.mkdir(exist_ok=True)
+            tmp_path.write_bytes(_json_dumps(index))
+            # Atomic swap, so a concurrent reader never sees a partial index
+            tmp_path.replace(index_path)
+        except OSError as e:
+            # A read-only plugins directory just means no warm starts
+            logger.debug(f"Could not write plugin index {index_path}: {e}")
+            return
+        self._index_dirty = False
+
+    def _parse_indexed_manifest(
+        self, plugin_dir: str
+    ) -> tuple[PluginManifest, _IndexUpdate | None]:
+        """Parse a plugin's manifest, reusing the index entry if unchanged.
+
+        Safe to call from discovery worker threads: the index is only read.
+
+        Args:
+            plugin_dir: Plugin directory
+
+        Returns:
+            Parsed PluginManifest dataclass and the index change to apply
+
+        Raises:
+            PluginValidationError: If the manifest is missing or invalid
+        """
+        manifest_path = os.path.join(plugin_dir, PLUGIN_MANIFEST_FILE)
+        try:
+            stat = os.stat(manifest_path)
+        except OSError as e:
+            raise PluginValidationError(f"Could not read manifest: {e}") from e
+
+        index = self._index if self._index is not None else {}
+        name = os.path.basename(plugin_dir)
+        signature = [stat.st_ino, stat.st_mtime_ns, stat.st_size]
+        entry = index.get(name)
+        if isinstance(entry, dict) and entry.get("stat") == signature:
+            # Validation still runs, so a hand-edited index cannot smuggle in
+            # an invalid manifest
+            return _manifest_from_data(entry["manifest"]), None
+
+        try:
+            with open(manifest_path, "rb") as f:
+                data = _decode_manifest(f.read())
+        except OSError as e:
+            raise PluginValidationError(f"Could not read manifest: {e}") from e
+        manifest = _manifest_from_data(data)
+
+        # Same racy-timestamp rule as parse_manifest's cache
+        if time.time_ns() - stat.st_mtime_ns >= MANIFEST_CACHE_MIN_AGE_NS:
+            return manifest, (name, {"stat": signature, "manifest": data})
+        return manifest, (name, None) if name in index else None
+
+    def _read_manifest(
+        self, plugin_dir: str
+    ) -> tuple[PluginManifest | None, _IndexUpdate | None]:
+        """Parse a plugin directory's manifest, logging why if it is unusable.
+
+        Args:
+            plugin_dir: Plugin directory
+
+        Returns:
+            The parsed manifest, or None if it is missing or invalid, and the
+            index change to apply
+        """
+        try:
+            manifest, update = self._parse_indexed_manifest(plugin_dir)
+        except PluginValidationError as e:
+            if isinstance(e.__cause__, FileNotFoundError):
+                logger.warning(f"No manifest found in {plugin_dir}")
+            else:
+                logger.error(f"Invalid manifest in {plugin_dir}: {e}")
+            return None, None
 
-            # Skip hidden directories and __pycache__
-            if entry.name.startswith(".") or entry.name == "__pycache__":
-                continue
+        logger.debug(f"Discovered plugin: {manifest.id} v{manifest.version}")
+        return manifest, update
 
-            manifest_path = entry / PLUGIN_MANIFEST_FILE
-            if not manifest_path.exists():
-                logger.warning(f"No manifest found in {entry}")
-                continue
+    def _read_manifest_and_layout(
+        self, plugin_dir: str
+    ) -> tuple[tuple[PluginManifest, PluginLayout] | None, _IndexUpdate | None]:
+        """Parse a plugin directory's manifest and check its layout.
 
-            try:
-                manifest = parse_manifest(manifest_path)
-                discovered.append((entry, manifest))
-                logger.debug(f"Discovered plugin: {manifest.id} v{manifest.version}")
-            except PluginValidationError as e:
-                logger.error(f"Invalid manifest in {entry}: {e}")
+        Args:
+            plugin_dir: Plugin directory
 
-        return discovered
+        Returns:
+            The parsed manifest and layout, or None if the manifest is
+            unusable, and the index change to apply
+        """
+        manifest, update = self._read_manifest(plugin_dir)
+        if manifest is None:
+            return None, update
+        layout = PluginLayout(
+            has_frontend=os.path.exists(os.path.join(plugin_dir, FRONTEND_ENTRY)),
+            has_backend=os.path.exists(os.path.join(plugin_dir, BACKEND_ENTRY)),
+        )
+        return (manifest, layout), update
 
     def install_from_zip(
         self,
@@ -381,103 +783,123 @@ class PluginLoader:
         Raises:
             PluginValidationError: If ZIP contents are invalid
         """
-        if not zip_path.exists():
-            raise PluginValidationError(f"ZIP file not found: {zip_path}")
-
-        if not zipfile.is_zipfile(zip_path):
-            raise PluginValidationError(f"Not a valid ZIP file: {zip_path}")
-
         logger.debug(f"Installing plugin from ZIP: {zip_path}")
 
-        with TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Extract ZIP
-            try:
-                with zipfile.ZipFile(zip_path, "r") as zf:
-                    zf.extractall(temp_path)
-            except zipfile.BadZipFile as e:
-                raise PluginValidationError(f"Corrupted ZIP file: {e}") from e
-
-            # Find manifest (might be in root or in a subdirectory)
-            manifest_path = temp_path / PLUGIN_MANIFEST_FILE
-            source_path = temp_path
-
-            if not manifest_path.exists():
-                # Check for single subdirectory containing manifest
-                subdirs = [
-                    d
-                    for d in temp_path.iterdir()
-                    if d.is_dir() and not d.name.startswith(".")
-                ]
-                if len(subdirs) == 1:
-                    manifest_path = subdirs[0] / PLUGIN_MANIFEST_FILE
-                    source_path = subdirs[0]
-
-            if not manifest_path.exists():
-                raise PluginValidationError(f"No {PLUGIN_MANIFEST_FILE} found in ZIP")
-
-            manifest = parse_manifest(manifest_path)
-
-            # Check if plugin already exists
-            target_dir = self.plugins_dir / manifest.id
-            old_version: str | None = None
-
-            if target_dir.exists():
-                if not upgrade:
+        # Opening reads the central directory, which is all is_zipfile() would
+        # have checked, so there is no separate validation pass
+        try:
+            zf = zipfile.ZipFile(zip_path, "r")
+        except FileNotFoundError as e:
+            raise PluginValidationError(f"ZIP file not found: {zip_path}") from e
+        except (zipfile.BadZipFile, IsADirectoryError) as e:
+            raise PluginValidationError(f"Not a valid ZIP file: {zip_path}") from e
+
+        try:
+            with zf:
+                infos = zf.infolist()
+                prefix = _find_manifest_prefix(infos)
+                if prefix is None:
                     raise PluginValidationError(
-                        f"Plugin {manifest.id} is already installed. "
-                        "Use the upgrade option to replace it with a new version."
+                        f"No {PLUGIN_MANIFEST_FILE} found in ZIP"
                     )
-
-                # Get old version before replacing
-                old_manifest_path = target_dir / PLUGIN_MANIFEST_FILE
-                if old_manifest_path.exists():
-                    try:
-                        old_manifest = parse_manifest(old_manifest_path)
-                        old_version = old_manifest.version
-                    except (
-                        PluginValidationError,
-                        OSError,
-                        json.JSONDecodeError,
-                    ) as exc:
-                        logger.warning(
-                            "Failed to parse existing manifest for plugin %s at %s: %s",
-                            manifest.id,
-                            old_manifest_path,
-                            exc,
+                manifest = _parse_manifest_bytes(zf.read(prefix + PLUGIN_MANIFEST_FILE))
+
+                # Check if plugin already exists
+                target_dir = self.plugins_dir / manifest.id
+                backup_dir = self.plugins_dir / f".{manifest.id}.old"
+                if backup_dir.exists():
+                    if target_dir.exists():
+                        shutil.rmtree(backup_dir)
+                    else:
+                        # An earlier upgrade stopped mid-swap; restore it
+                        backup_dir.rename(target_dir)
+                old_version: str | None = None
+
+                replacing = target_dir.exists()
+                if replacing:
+                    if not upgrade:
+                        raise PluginValidationError(
+                            f"Plugin {manifest.id} is already installed. "
+                            "Use the upgrade option to replace it with a new version."
                         )
-                        old_version = "unknown"
+                    old_version = self._installed_version(manifest.id, target_dir)
 
-                # Remove old plugin directory
-                logger.info(
-                    f"Upgrading plugin {manifest.id}: "
-                    f"{old_version} -> {manifest.version}"
-                )
-                shutil.rmtree(target_dir)
-
-            # Validate required permissions
-            checker = PermissionChecker()
-            dangerous = checker.get_dangerous_permissions(manifest.required_permissions)
-            if dangerous:
-                logger.warning(
-                    f"Plugin {manifest.id} requests dangerous permissions: "
-                    f"{[p.value for p in dangerous]}"
+                # Validate required permissions
+                checker = PermissionChecker()
+                dangerous = checker.get_dangerous_permissions(
+                    manifest.required_permissions
                 )
+                if dangerous:
+                    logger.warning(
+                        f"Plugin {manifest.id} requests dangerous permissions: "
+                        f"{[p.value for p in dangerous]}"
+                    )
 
-            # Copy to plugins directory
-            shutil.copytree(source_path, target_dir)
-
-            if old_version:
-                logger.info(
-                    f"Upgraded plugin {manifest.id}: "
-                    f"{old_version} -> {manifest.version}"
-                )
-            else:
-                logger.info(f"Installed plugin {manifest.id} v{manifest.version}")
+                # Extract next to the target, then swap it into place with
+                # renames: no second copy, and a failed extraction or swap
+                # never leaves a half-installed plugin behind. The old version
+                # is moved aside and only deleted once the new one is in
+                # place. Hidden names are ignored by discovery, so the staging
+                # and backup directories are never picked up.
+                staging_dir = self.plugins_dir / f".{manifest.id}.installing"
+                if staging_dir.exists():
+                    shutil.rmtree(staging_dir)
+                try:
+                    _extract_members(zf, infos, prefix, staging_dir)
+                    if replacing:
+                        logger.info(
+                            f"Upgrading plugin {manifest.id}: "
+                            f"{old_version} -> {manifest.version}"
+                        )
+                        target_dir.rename(backup_dir)
+                    try:
+                        staging_dir.rename(target_dir)
+                    except BaseException:
+                        if replacing:
+                            backup_dir.rename(target_dir)
+                        raise
+                except BaseException:
+                    shutil.rmtree(staging_dir, ignore_errors=True)
+                    raise
+                if replacing:
+                    shutil.rmtree(backup_dir, ignore_errors=True)
+        except zipfile.BadZipFile as e:
+            raise PluginValidationError(f"Corrupted ZIP file: {e}") from e
+
+        if old_version:
+            logger.info(
+                f"Upgraded plugin {manifest.id}: {old_version} -> {manifest.version}"
+            )
+        else:
+            logger.info(f"Installed plugin {manifest.id} v{manifest.version}")
 
         return manifest, old_version
 
+    def _installed_version(self, plugin_id: str, plugin_dir: Path) -> str | None:
+        """Return the version of an installed plugin about to be replaced.
+
+        Args:
+            plugin_id: ID of the installed plugin
+            plugin_dir: Directory the plugin is installed in
+
+        Returns:
+            The installed version, "unknown" if its manifest is unreadable,
+            or None if it has no manifest
+        """
+        old_manifest_path = plugin_dir / PLUGIN_MANIFEST_FILE
+        if not old_manifest_path.exists():
+            return None
+        try:
+            return parse_manifest(old_manifest_path).version
+        except (PluginValidationError, OSError) as exc:
+            logger.warning(
+                "Failed to parse existing manifest for plugin %s at %s: %s",
+                plugin_id,
+                old_manifest_path,
+                exc,
+            )
+            return "unknown"
+
     def uninstall(self, plugin_id: str) -> None:
         """Uninstall a plugin by removing its directory.
 
@@ -485,11 +907,15 @@ class PluginLoader:
             plugin_id: ID of the plugin to uninstall
         """
         plugin_dir = self.plugins_dir / plugin_id
-        if plugin_dir.exists():
+        # shutil.rmtree already walks with scandir and the cached dirent type
+        # (fd-based, so it is also safe against symlink swaps); just skip the
+        # separate existence check
+        try:
             shutil.rmtree(plugin_dir)
-            logger.info(f"Uninstalled plugin {plugin_id}")
-        else:
+        except FileNotFoundError:
             logger.warning(f"Plugin directory not found: {plugin_dir}")
+            return
+        logger.info(f"Uninstalled plugin {plugin_id}")
 
     def get_plugin_path(self, plugin_id: str) -> Path | None:
         """Get the path to a plugin's directory.
@@ -501,7 +927,8 @@ class PluginLoader:
             Path to plugin directory or None if not found
         """
         plugin_path = self.plugins_dir / plugin_id
-        if plugin_path.exists() and plugin_path.is_dir():
+        # is_dir() is False for missing paths, so one stat answers both
+        if plugin_path.is_dir():
             return plugin_path
         return None
 
@@ -546,9 +973,7 @@ class PluginLoader:
         Returns:
             True if plugin has frontend/index.js
         """
-        plugin_path = self.plugins_dir / plugin_id
-        frontend_index = plugin_path / "frontend" / "index.js"
-        return frontend_index.exists()
+        return (self.plugins_dir / plugin_id / FRONTEND_ENTRY).exists()
 
     def has_backend(self, plugin_id: str) -> bool:
         """Check if a plugin has backend code.
@@ -559,6 +984,4 @@ class PluginLoader:
         Returns:
             True if plugin has backend/plugin.py
         """
-        plugin_path = self.plugins_dir / plugin_id
-        backend_plugin = plugin_path / "backend" / "plugin.py"
-        return backend_plugin.exists()
+        return (self.plugins_dir / plugin_id / BACKEND_ENTRY).exists()
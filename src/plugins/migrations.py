@@ -4,6 +4,7 @@
 
 import logging
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -184,7 +185,7 @@ class PluginMigrationRunner:
         # Common table prefix patterns for plugins
         # Most plugins use a prefix like "tt_" (time-tracking), "ex_" (example), etc.
         # We derive the prefix from the plugin_id: "time-tracking" -> "tt_"
-        prefix = self._get_table_prefix()
+        prefix = self.table_prefix
 
         inspector = inspect(engine)
         all_tables = inspector.get_table_names()
@@ -230,7 +231,12 @@ class PluginMigrationRunner:
         logger.info(f"Force dropped tables for plugin {self.plugin_id}")
 
     def _get_table_prefix(self) -> str:
-        """Get the table prefix for this plugin.
+        """Get the table prefix for this plugin (see table_prefix)."""
+        return self.table_prefix
+
+    @cached_property
+    def table_prefix(self) -> str:
+        """Table prefix for this plugin, computed once per runner.
 
         If the plugin manifest specifies a table_prefix, uses that value.
         Otherwise, derives a prefix from the plugin_id. For example:
@@ -5,23 +5,31 @@
 from src.plugins.base import Permission
 
 # Permissions that require admin approval or special handling
-DANGEROUS_PERMISSIONS: set[Permission] = {
-    Permission.USER_WRITE_ALL,
-    Permission.INTEGRATION_CONFIG,
-    Permission.SYSTEM_SETTINGS_WRITE,
-}
+DANGEROUS_PERMISSIONS: frozenset[Permission] = frozenset(
+    {
+        Permission.USER_WRITE_ALL,
+        Permission.INTEGRATION_CONFIG,
+        Permission.SYSTEM_SETTINGS_WRITE,
+    }
+)
 
 # Permissions that are safe for most plugins
-SAFE_PERMISSIONS: set[Permission] = {
-    Permission.USER_READ,
-    Permission.USER_WRITE_SELF,
-    Permission.EVENT_READ,
-    Permission.COMPANY_READ,
-    Permission.EXPENSE_READ,
-    Permission.CALENDAR_READ,
-    Permission.INTEGRATION_USE,
-    Permission.SYSTEM_SETTINGS_READ,
-}
+SAFE_PERMISSIONS: frozenset[Permission] = frozenset(
+    {
+        Permission.USER_READ,
+        Permission.USER_WRITE_SELF,
+        Permission.EVENT_READ,
+        Permission.COMPANY_READ,
+        Permission.EXPENSE_READ,
+        Permission.CALENDAR_READ,
+        Permission.INTEGRATION_USE,
+        Permission.SYSTEM_SETTINGS_READ,
+    }
+)
+
+# Value -> member table, so unknown strings are a dict miss instead of a
+# ValueError raised and caught inside the enum lookup
+_PERMISSIONS_BY_VALUE: dict[str, Permission] = {p.value: p for p in Permission}
 
 
 class PermissionChecker:
@@ -64,11 +72,9 @@ class PermissionChecker:
         Returns:
             True if valid, False otherwise
         """
-        try:
-            Permission(permission_str)
-            return True
-        except ValueError:
-            return False
+        return (
+            isinstance(permission_str, str) and permission_str in _PERMISSIONS_BY_VALUE
+        )
 
     def parse_permissions(
         self,
@@ -86,10 +92,16 @@ class PermissionChecker:
         invalid: list[str] = []
 
         for perm_str in permission_strings:
-            try:
-                valid.add(Permission(perm_str))
-            except ValueError:
+            # Malformed manifests may contain unhashable entries (objects)
+            permission = (
+                _PERMISSIONS_BY_VALUE.get(perm_str)
+                if isinstance(perm_str, str)
+                else None
+            )
+            if permission is None:
                 invalid.append(perm_str)
+            else:
+                valid.add(permission)
 
         return valid, invalid
 
@@ -108,7 +120,7 @@ class PermissionChecker:
             Tuple of (all_granted, missing_permissions)
         """
         missing = required - granted
-        return len(missing) == 0, missing
+        return not missing, missing
 
     def format_permissions_for_display(
         self,
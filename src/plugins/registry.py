@@ -101,14 +101,19 @@ class PluginRegistry:
         discovered = self._loader.discover_plugins()
         logger.info(f"Discovered {len(discovered)} plugins")
 
-        for plugin_path, manifest in discovered:
-            # Get config from database
-            db_config = (
-                db.query(PluginConfigModel)
-                .filter(PluginConfigModel.plugin_id == manifest.id)
-                .first()
+        # Fetch every matching config in one query rather than one per plugin
+        db_configs = {
+            db_config.plugin_id: db_config
+            for db_config in db.query(PluginConfigModel).filter(
+                PluginConfigModel.plugin_id.in_(
+                    [manifest.id for _, manifest in discovered]
+                )
             )
+        }
+        versions_changed = False
 
+        for plugin_path, manifest in discovered:
+            db_config = db_configs.get(manifest.id)
             if db_config is None:
                 # Plugin on disk but not in database - skip
                 logger.info(f"Skipping unregistered plugin: {manifest.id}")
@@ -121,7 +126,7 @@ class PluginRegistry:
                     f"{db_config.plugin_version} -> {manifest.version}"
                 )
                 db_config.plugin_version = manifest.version
-                db.commit()
+                versions_changed = True
 
             config = PluginConfig(
                 settings=db_config.get_decrypted_settings(),
@@ -132,6 +137,9 @@ class PluginRegistry:
             except Exception as e:
                 logger.error(f"Failed to load plugin {manifest.id}: {e}")
 
+        if versions_changed:
+            db.commit()
+
         self._initialized = True
 
     async def _load_single_plugin(
@@ -164,8 +172,7 @@ class PluginRegistry:
         handlers = plugin.get_event_handlers()
         for event_name, handler in handlers.items():
             try:
-                event_type = AppEvent(event_name)
-                event_bus.subscribe(event_type, handler, manifest.id)
+                event_bus.subscribe(event_name, handler, manifest.id)
             except ValueError:
                 logger.warning(
                     f"Plugin {manifest.id} subscribed to unknown event: {event_name}"
@@ -5,6 +5,7 @@
 import json
 import uuid
 
+from sqlalchemy import exists
 from sqlalchemy.orm import Session
 
 from src.models import CompanyContact
@@ -54,9 +55,11 @@ def create_contact(
     the main contact. If is_main_contact is True, it unsets any existing
     main contact.
     """
-    # Check if this will be the first contact - make it main automatically
-    existing_contacts = get_contacts(db, company_id)
-    is_first_contact = len(existing_contacts) == 0
+    # Check if this will be the first contact - make it main automatically.
+    # EXISTS avoids loading every contact of the company just to count them.
+    is_first_contact = not db.query(
+        exists().where(CompanyContact.company_id == company_id)
+    ).scalar()
 
     # If requesting to be main contact, unset existing main
     if data.is_main_contact and not is_first_contact:
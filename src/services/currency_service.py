@@ -2,12 +2,16 @@
 # SPDX-License-Identifier: GPL-2.0-only
 """Currency conversion service using frankfurter.app API."""
 
+import asyncio
 import logging
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
 from decimal import Decimal
 
 import httpx
+from sqlalchemy import bindparam, select
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
 
 from src.models.currency_cache import CurrencyCache
@@ -23,6 +27,33 @@ CACHE_FRESHNESS_HOURS = 24
 # Maximum days to look back for a rate when exact date unavailable
 MAX_RATE_LOOKBACK_DAYS = 7
 
+# Maximum API requests in flight when fetching many rates at once
+MAX_CONCURRENT_FETCHES = 5
+
+# (from_currency, to_currency, rate_date) as passed to get_rates_bulk
+RateRequest = tuple[str, str, date]
+
+# Cache lookups run on every expense conversion, so their statements are built
+# once here and only the bound parameters change between executions.
+_CACHED_RATE_STMT = select(CurrencyCache).where(
+    CurrencyCache.base_currency == bindparam("base"),
+    CurrencyCache.target_currency == bindparam("target"),
+    CurrencyCache.rate_date == bindparam("rate_date"),
+)
+_CACHED_RATE_RANGE_STMT = (
+    select(CurrencyCache.rate, CurrencyCache.rate_date, CurrencyCache.fetched_at)
+    .where(
+        CurrencyCache.base_currency == bindparam("base"),
+        CurrencyCache.target_currency == bindparam("target"),
+        CurrencyCache.rate_date <= bindparam("newest"),
+        CurrencyCache.rate_date >= bindparam("oldest"),
+    )
+    .order_by(CurrencyCache.rate_date.desc())
+)
+
+# INSERT constructs supporting ON CONFLICT, by dialect name
+_UPSERT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
 
 @dataclass
 class Currency:
@@ -43,6 +74,37 @@ class ConversionResult:
     exchange_rate: Decimal
     rate_date: date
 
+    @classmethod
+    def from_rate(
+        cls,
+        amount: Decimal,
+        from_currency: str,
+        to_currency: str,
+        rate: Decimal,
+        rate_date: date,
+    ) -> ConversionResult:
+        """Build the result of converting amount at an already known rate.
+
+        Args:
+            amount: Amount to convert.
+            from_currency: Source currency code.
+            to_currency: Target currency code.
+            rate: Exchange rate from source to target currency.
+            rate_date: Date the exchange rate applies to.
+
+        Returns:
+            ConversionResult with the amount rounded to 2 decimal places.
+        """
+        return cls(
+            original_amount=amount,
+            original_currency=from_currency.upper(),
+            # Round to 2 decimal places for currency
+            converted_amount=(amount * rate).quantize(Decimal("0.01")),
+            target_currency=to_currency.upper(),
+            exchange_rate=rate,
+            rate_date=rate_date,
+        )
+
 
 class CurrencyServiceError(Exception):
     """Base exception for currency service errors."""
@@ -52,6 +114,18 @@ class RateNotFoundError(CurrencyServiceError):
     """Exchange rate could not be found."""
 
 
+# Supported currencies, shared by every CurrencyService instance. The list
+# only changes when the ECB adds or drops a currency, so it is fetched once
+# per process instead of once per request-scoped service.
+_supported_currencies: tuple[Currency, ...] | None = None
+
+
+def clear_supported_currencies_cache() -> None:
+    """Forget the cached supported currencies so the next call refetches them."""
+    global _supported_currencies
+    _supported_currencies = None
+
+
 class CurrencyService:
     """Service for currency conversion and exchange rate management."""
 
@@ -63,7 +137,6 @@ class CurrencyService:
         """
         self.db = db
         self._http_client: httpx.AsyncClient | None = None
-        self._supported_currencies: dict[str, str] | None = None
 
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create the HTTP client."""
@@ -83,27 +156,31 @@ class CurrencyService:
     async def get_supported_currencies(self) -> list[Currency]:
         """Fetch list of supported currencies from the API.
 
+        The list is cached for the lifetime of the process and shared by all
+        service instances; see clear_supported_currencies_cache().
+
         Returns:
             List of Currency objects with code and name.
 
         Raises:
             CurrencyServiceError: If API call fails.
         """
-        if self._supported_currencies is not None:
-            return [
-                Currency(code=code, name=name)
-                for code, name in sorted(self._supported_currencies.items())
-            ]
+        global _supported_currencies
+        if _supported_currencies is not None:
+            return list(_supported_currencies)
 
         try:
             client = await self._get_client()
             response = await client.get("/currencies")
             response.raise_for_status()
-            self._supported_currencies = response.json()
-            return [
+            # No lock: concurrent first calls may both fetch, but they store
+            # the same list, and a module-level asyncio.Lock would be bound to
+            # whichever event loop used it first (see the sync wrapper below).
+            _supported_currencies = tuple(
                 Currency(code=code, name=name)
-                for code, name in sorted(self._supported_currencies.items())
-            ]
+                for code, name in sorted(response.json().items())
+            )
+            return list(_supported_currencies)
         except httpx.HTTPError as e:
             logger.error(f"Failed to fetch currencies: {e}")
             raise CurrencyServiceError(f"Failed to fetch currencies: {e}") from e
@@ -131,13 +208,13 @@ class CurrencyService:
             RateNotFoundError: If no rate found within lookback period.
             CurrencyServiceError: If API call fails.
         """
-        # Same currency = rate of 1
-        if from_currency.upper() == to_currency.upper():
-            return Decimal("1.0"), rate_date
-
         from_currency = from_currency.upper()
         to_currency = to_currency.upper()
 
+        # Same currency = rate of 1
+        if from_currency == to_currency:
+            return Decimal("1.0"), rate_date
+
         # Try to find cached rate for exact date or nearby dates
         cached_rate = self._get_cached_rate(from_currency, to_currency, rate_date)
         if cached_rate is not None:
@@ -146,6 +223,78 @@ class CurrencyService:
         # Fetch from API
         return await self._fetch_and_cache_rate(from_currency, to_currency, rate_date)
 
+    async def get_rates_bulk(
+        self,
+        requests: Iterable[RateRequest],
+    ) -> dict[RateRequest, tuple[Decimal, date] | CurrencyServiceError]:
+        """Get exchange rates for many (from, to, date) requests at once.
+
+        Cached rates are looked up with one query per currency pair. The
+        remaining distinct requests are fetched from the API concurrently
+        and cached with a single commit.
+
+        Args:
+            requests: (from_currency, to_currency, rate_date) tuples.
+
+        Returns:
+            Dict mapping each request to its (exchange_rate, actual_rate_date),
+            or to the CurrencyServiceError raised while fetching it.
+        """
+        results: dict[RateRequest, tuple[Decimal, date] | CurrencyServiceError] = {}
+        # Normalized request -> the caller's requests that share it
+        pending: dict[RateRequest, list[RateRequest]] = {}
+        for request in requests:
+            from_currency, to_currency, rate_date = request
+            key = (from_currency.upper(), to_currency.upper(), rate_date)
+            if key[0] == key[1]:
+                results[request] = Decimal("1.0"), rate_date
+            else:
+                pending.setdefault(key, []).append(request)
+
+        dates_by_pair: dict[tuple[str, str], list[date]] = {}
+        for from_currency, to_currency, rate_date in pending:
+            dates_by_pair.setdefault((from_currency, to_currency), []).append(rate_date)
+
+        resolved: dict[RateRequest, tuple[Decimal, date] | CurrencyServiceError] = {}
+        for (from_currency, to_currency), dates in dates_by_pair.items():
+            cached = self._get_cached_rates(from_currency, to_currency, dates)
+            for rate_date, rate in cached.items():
+                resolved[from_currency, to_currency, rate_date] = rate
+
+        misses = [key for key in pending if key not in resolved]
+        if misses:
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+
+            async def fetch(
+                key: RateRequest,
+            ) -> tuple[Decimal, date] | CurrencyServiceError:
+                async with semaphore:
+                    try:
+                        return await self._fetch_rate(*key)
+                    except CurrencyServiceError as e:
+                        return e
+
+            fetched = await asyncio.gather(*(fetch(key) for key in misses))
+
+            # Several requested dates can resolve to the same published rate
+            # (e.g. a whole weekend), so store each one only once
+            to_cache: dict[RateRequest, Decimal] = {}
+            for (from_currency, to_currency, _), outcome in zip(
+                misses, fetched, strict=True
+            ):
+                if not isinstance(outcome, CurrencyServiceError):
+                    rate, actual_date = outcome
+                    to_cache[from_currency, to_currency, actual_date] = rate
+            if to_cache:
+                self._persist_rates(to_cache)
+
+            resolved.update(zip(misses, fetched, strict=True))
+
+        for key, originals in pending.items():
+            for request in originals:
+                results[request] = resolved[key]
+        return results
+
     def _get_cached_rate(
         self,
         from_currency: str,
@@ -157,28 +306,50 @@ class CurrencyService:
         Checks for rates within MAX_RATE_LOOKBACK_DAYS, preferring exact date,
         then most recent date before the requested date.
         """
-        min_date = rate_date - timedelta(days=MAX_RATE_LOOKBACK_DAYS)
-
-        # Look for rates in the date range, ordered by date descending
-        cached = (
-            self.db.query(CurrencyCache)
-            .filter(
-                CurrencyCache.base_currency == from_currency,
-                CurrencyCache.target_currency == to_currency,
-                CurrencyCache.rate_date <= rate_date,
-                CurrencyCache.rate_date >= min_date,
-            )
-            .order_by(CurrencyCache.rate_date.desc())
-            .first()
+        return self._get_cached_rates(from_currency, to_currency, [rate_date]).get(
+            rate_date
         )
 
-        if cached is not None:
+    def _get_cached_rates(
+        self,
+        from_currency: str,
+        to_currency: str,
+        rate_dates: list[date],
+    ) -> dict[date, tuple[Decimal, date]]:
+        """Look up fresh cached rates for several dates of one currency pair.
+
+        Uses a single query covering all dates. For each date the most recent
+        rate within MAX_RATE_LOOKBACK_DAYS on or before it is used, provided
+        it was fetched less than CACHE_FRESHNESS_HOURS ago.
+
+        Returns:
+            Dict mapping each date with a usable cached rate to its
+            (exchange_rate, actual_rate_date).
+        """
+        lookback = timedelta(days=MAX_RATE_LOOKBACK_DAYS)
+
+        # Rates in the covered date range, ordered by date descending
+        cached = self.db.execute(
+            _CACHED_RATE_RANGE_STMT,
+            {
+                "base": from_currency,
+                "target": to_currency,
+                "newest": max(rate_dates),
+                "oldest": min(rate_dates) - lookback,
+            },
+        ).all()
+
+        now = datetime.utcnow()
+        found: dict[date, tuple[Decimal, date]] = {}
+        for rate_date in rate_dates:
+            row = next((row for row in cached if row.rate_date <= rate_date), None)
+            if row is None or row.rate_date < rate_date - lookback:
+                continue
             # Check if cache is fresh enough
-            cache_age = datetime.utcnow() - cached.fetched_at
-            if cache_age < timedelta(hours=CACHE_FRESHNESS_HOURS):
-                return cached.rate, cached.rate_date
+            if now - row.fetched_at < timedelta(hours=CACHE_FRESHNESS_HOURS):
+                found[rate_date] = row.rate, row.rate_date
 
-        return None
+        return found
 
     async def _fetch_and_cache_rate(
         self,
@@ -186,7 +357,20 @@ class CurrencyService:
         to_currency: str,
         rate_date: date,
     ) -> tuple[Decimal, date]:
-        """Fetch rate from API and cache it.
+        """Fetch rate from API and cache it."""
+        rate, actual_date = await self._fetch_rate(
+            from_currency, to_currency, rate_date
+        )
+        self._cache_rate(from_currency, to_currency, rate, actual_date)
+        return rate, actual_date
+
+    async def _fetch_rate(
+        self,
+        from_currency: str,
+        to_currency: str,
+        rate_date: date,
+    ) -> tuple[Decimal, date]:
+        """Fetch rate from API without caching it.
 
         The API returns the nearest available rate if exact date is unavailable
         (e.g., weekends return Friday's rate).
@@ -207,9 +391,6 @@ class CurrencyService:
             actual_date = date.fromisoformat(data["date"])
             rate = Decimal(str(data["rates"][to_currency]))
 
-            # Cache the rate
-            self._cache_rate(from_currency, to_currency, rate, actual_date)
-
             return rate, actual_date
 
         except httpx.HTTPStatusError as e:
@@ -230,7 +411,7 @@ class CurrencyService:
         from_currency: str,
         to_currency: str,
     ) -> tuple[Decimal, date]:
-        """Fetch the latest available rate as a fallback."""
+        """Fetch the latest available rate from the API as a fallback."""
         try:
             client = await self._get_client()
             response = await client.get(
@@ -243,8 +424,6 @@ class CurrencyService:
             actual_date = date.fromisoformat(data["date"])
             rate = Decimal(str(data["rates"][to_currency]))
 
-            self._cache_rate(from_currency, to_currency, rate, actual_date)
-
             return rate, actual_date
 
         except httpx.HTTPError as e:
@@ -261,15 +440,60 @@ class CurrencyService:
         rate_date: date,
     ) -> None:
         """Store a rate in the cache, updating if exists."""
-        existing = (
-            self.db.query(CurrencyCache)
-            .filter(
-                CurrencyCache.base_currency == from_currency,
-                CurrencyCache.target_currency == to_currency,
-                CurrencyCache.rate_date == rate_date,
+        self._store_rate(from_currency, to_currency, rate, rate_date)
+        self.db.commit()
+
+    def _persist_rates(self, rates: dict[RateRequest, Decimal]) -> None:
+        """Insert or refresh many cached rates and commit once.
+
+        On PostgreSQL and SQLite this is a single INSERT ... ON CONFLICT DO
+        UPDATE, so stale rows get the new rate and fetched_at. Other
+        databases fall back to one lookup per rate.
+
+        Args:
+            rates: Rates keyed by (from_currency, to_currency, rate_date).
+        """
+        upsert = _UPSERT_INSERTS.get(self.db.get_bind().dialect.name)
+        if upsert is None:
+            for (from_currency, to_currency, rate_date), rate in rates.items():
+                self._store_rate(from_currency, to_currency, rate, rate_date)
+        else:
+            stmt = upsert(CurrencyCache)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["base_currency", "target_currency", "rate_date"],
+                set_={
+                    "rate": stmt.excluded.rate,
+                    "fetched_at": stmt.excluded.fetched_at,
+                },
             )
-            .first()
-        )
+            fetched_at = datetime.utcnow()
+            self.db.execute(
+                stmt,
+                [
+                    {
+                        "base_currency": from_currency,
+                        "target_currency": to_currency,
+                        "rate": rate,
+                        "rate_date": rate_date,
+                        "fetched_at": fetched_at,
+                    }
+                    for (from_currency, to_currency, rate_date), rate in rates.items()
+                ],
+            )
+        self.db.commit()
+
+    def _store_rate(
+        self,
+        from_currency: str,
+        to_currency: str,
+        rate: Decimal,
+        rate_date: date,
+    ) -> None:
+        """Add or update a cached rate without committing."""
+        existing = self.db.execute(
+            _CACHED_RATE_STMT,
+            {"base": from_currency, "target": to_currency, "rate_date": rate_date},
+        ).scalar_one_or_none()
 
         if existing:
             existing.rate = rate
@@ -284,8 +508,6 @@ class CurrencyService:
             )
             self.db.add(cache_entry)
 
-        self.db.commit()
-
     async def convert(
         self,
         amount: Decimal,
@@ -311,18 +533,8 @@ class CurrencyService:
         rate, actual_date = await self.get_rate(
             from_currency, to_currency, expense_date
         )
-        converted = amount * rate
-
-        # Round to 2 decimal places for currency
-        converted = converted.quantize(Decimal("0.01"))
-
-        return ConversionResult(
-            original_amount=amount,
-            original_currency=from_currency.upper(),
-            converted_amount=converted,
-            target_currency=to_currency.upper(),
-            exchange_rate=rate,
-            rate_date=actual_date,
+        return ConversionResult.from_rate(
+            amount, from_currency, to_currency, rate, actual_date
         )
 
 
@@ -354,6 +566,8 @@ async def backfill_expense_conversions(db: Session) -> dict:
 
     service = CurrencyService(db)
     try:
+        # Expenses in a foreign currency, with the currency to convert into
+        to_convert: list[tuple[Expense, str]] = []
         for expense in expenses:
             # Get the event to find company base currency
             event = db.query(Event).filter(Event.id == expense.event_id).first()
@@ -369,22 +583,26 @@ async def backfill_expense_conversions(db: Session) -> dict:
                 expense.rate_date = expense.date
                 results["converted"] += 1
             else:
-                try:
-                    result = await service.convert(
-                        expense.amount,
-                        expense.currency,
-                        base_currency,
-                        expense.date,
-                    )
-                    expense.converted_amount = result.converted_amount
-                    expense.exchange_rate = result.exchange_rate
-                    expense.rate_date = result.rate_date
-                    results["converted"] += 1
-                except CurrencyServiceError as e:
-                    logger.warning(
-                        f"Failed to convert expense {expense.id}: {e}"
-                    )
-                    results["failed"] += 1
+                to_convert.append((expense, base_currency))
+
+        # Resolve all rates together so missing ones are fetched concurrently
+        rates = await service.get_rates_bulk(
+            (expense.currency, base_currency, expense.date)
+            for expense, base_currency in to_convert
+        )
+        for expense, base_currency in to_convert:
+            rate = rates[expense.currency, base_currency, expense.date]
+            if isinstance(rate, CurrencyServiceError):
+                logger.warning(f"Failed to convert expense {expense.id}: {rate}")
+                results["failed"] += 1
+                continue
+            result = ConversionResult.from_rate(
+                expense.amount, expense.currency, base_currency, *rate
+            )
+            expense.converted_amount = result.converted_amount
+            expense.exchange_rate = result.exchange_rate
+            expense.rate_date = result.rate_date
+            results["converted"] += 1
 
         db.commit()
     finally:
@@ -400,8 +618,6 @@ def get_supported_currencies_sync(db: Session) -> list[Currency]:
     For use in schema validation and other sync contexts.
     Uses cached data if available.
     """
-    import asyncio
-
     service = CurrencyService(db)
     try:
         loop = asyncio.get_event_loop()
@@ -34,39 +34,47 @@ async def ensure_expense_conversions(
     Returns:
         The same list of expenses, now with conversion data populated.
     """
-    from src.services.currency_service import CurrencyService, CurrencyServiceError
+    from src.services.currency_service import (
+        ConversionResult,
+        CurrencyService,
+        CurrencyServiceError,
+    )
 
     # Filter to expenses needing conversion
     needs_conversion = [e for e in expenses if e.converted_amount is None]
     if not needs_conversion:
         return expenses
 
+    # Same currency - no conversion needed
+    base_code = base_currency.upper()
+    foreign: list[Expense] = []
+    for expense in needs_conversion:
+        if expense.currency.upper() == base_code:
+            expense.converted_amount = expense.amount
+            expense.exchange_rate = Decimal("1.0")
+            expense.rate_date = expense.date
+        else:
+            foreign.append(expense)
+
     service = CurrencyService(db)
     try:
-        for expense in needs_conversion:
-            if expense.currency.upper() == base_currency.upper():
-                # Same currency - no conversion needed
-                expense.converted_amount = expense.amount
-                expense.exchange_rate = Decimal("1.0")
-                expense.rate_date = expense.date
-            else:
-                # Different currency - fetch rate and convert
-                try:
-                    result = await service.convert(
-                        expense.amount,
-                        expense.currency,
-                        base_currency,
-                        expense.date,
-                    )
-                    expense.converted_amount = result.converted_amount
-                    expense.exchange_rate = result.exchange_rate
-                    expense.rate_date = result.rate_date
-                except CurrencyServiceError as e:
-                    logger.warning(
-                        f"Failed to convert expense {expense.id}: {e}"
-                    )
-                    # Skip this expense, leave converted_amount as None
-                    continue
+        # Resolve all rates together so missing ones are fetched concurrently
+        rates = await service.get_rates_bulk(
+            (expense.currency, base_currency, expense.date) for expense in foreign
+        )
+        for expense in foreign:
+            # Different currency - convert with the fetched rate
+            rate = rates[expense.currency, base_currency, expense.date]
+            if isinstance(rate, CurrencyServiceError):
+                logger.warning(f"Failed to convert expense {expense.id}: {rate}")
+                # Skip this expense, leave converted_amount as None
+                continue
+            result = ConversionResult.from_rate(
+                expense.amount, expense.currency, base_currency, *rate
+            )
+            expense.converted_amount = result.converted_amount
+            expense.exchange_rate = result.exchange_rate
+            expense.rate_date = result.rate_date
 
         db.commit()
     finally:
@@ -287,6 +295,7 @@ def get_expense_summary(db: Session, event_id: uuid.UUID) -> dict:
 
     # Track currencies that were converted
     converted_currencies: set[str] = set()
+    base_code = base_currency.upper()
 
     for expense in expenses:
         # Use converted amount for aggregations
@@ -303,8 +312,9 @@ def get_expense_summary(db: Session, event_id: uuid.UUID) -> dict:
         by_payment_type[pt] = by_payment_type.get(pt, 0) + amount
 
         # Track if this expense was converted from a different currency
-        if expense.currency.upper() != base_currency.upper():
-            converted_currencies.add(expense.currency.upper())
+        currency = expense.currency.upper()
+        if currency != base_code:
+            converted_currencies.add(currency)
 
     return {
         "total": float(total),
@@ -1,44 +1,108 @@
 # SPDX-FileCopyrightText: 2025 Roland Knall <rknall@gmail.com>
 # SPDX-License-Identifier: GPL-2.0-only
 import os
+from functools import partial
 
+import bcrypt
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 
-# Set test environment before importing app
+# Set test environment before importing app. Each pytest-xdist worker gets
+# its own database file so `pytest -n auto` workers never share (or drop)
+# each other's schema.
 os.environ["SECRET_KEY"] = "test-secret-key-for-testing-only-32chars!"  # nosec - test-only secret  # noqa: S105
-os.environ["DATABASE_URL"] = "sqlite:///./test.db"
+os.environ["DATABASE_URL"] = (
+    f"sqlite:///./test{os.environ.get('PYTEST_XDIST_WORKER', '')}.db"
+)
 
+from src.api import deps
 from src.database import get_db
 from src.main import app
-from src.models import User
+from src.models import PluginConfigModel, User
 from src.models.base import Base
 from src.security import get_password_hash
-from src.services import rbac_service
+from src.services import auth_service, rbac_service
 from src.services.rbac_seed_service import seed_rbac_data
 
 # Test database setup
-TEST_DATABASE_URL = "sqlite:///./test.db"
+TEST_DATABASE_URL = os.environ["DATABASE_URL"]
 engine = create_engine(TEST_DATABASE_URL, connect_args={"check_same_thread": False})
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
-@pytest.fixture(scope="function")
-def db_session():
-    """Create a fresh database for each test."""
+# pysqlite issues its own BEGIN lazily and breaks SAVEPOINT semantics; let
+# SQLAlchemy control transactions so tests can roll back nested ones. The
+# test database is disposable, so skip the rollback journal and fsyncs too.
+@event.listens_for(engine, "connect")
+def _configure_sqlite(dbapi_connection, _connection_record):
+    dbapi_connection.isolation_level = None
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=MEMORY")
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
+@event.listens_for(engine, "begin")
+def _emit_begin(connection):
+    connection.exec_driver_sql("BEGIN")
+
+
+@pytest.fixture(scope="session")
+def db_connection():
+    """Create the schema once and hold the connection every test runs on."""
+    Base.metadata.drop_all(bind=engine)
     Base.metadata.create_all(bind=engine)
-    session = TestingSessionLocal()
+    connection = engine.connect()
+    try:
+        yield connection
+    finally:
+        connection.close()
+        Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture(scope="function")
+def db_session(db_connection):
+    """Run each test in a transaction that is rolled back afterwards.
+
+    Session commits only release a SAVEPOINT, so tests (and the API, which
+    shares this session through the client fixture) can commit freely
+    without leaking rows into the next test.
+    """
+    transaction = db_connection.begin()
+    session = TestingSessionLocal(
+        bind=db_connection, join_transaction_mode="create_savepoint"
+    )
     try:
         yield session
     finally:
         session.close()
-        Base.metadata.drop_all(bind=engine)
+        transaction.rollback()
+
+
+@pytest.fixture(scope="session")
+def app_client(db_connection):
+    """Run the application lifespan once and share the client across tests.
+
+    Startup seeding and plugin loading run on the test connection inside a
+    transaction that is rolled back as soon as startup finishes, so the
+    lifespan neither runs before the schema exists nor leaves rows behind.
+    """
+    transaction = db_connection.begin()
+    startup_session = sessionmaker(
+        bind=db_connection, join_transaction_mode="create_savepoint"
+    )
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("src.main.SessionLocal", startup_session)
+        with TestClient(app) as test_client:
+            transaction.rollback()
+            yield test_client
 
 
 @pytest.fixture(scope="function")
-def client(db_session):
+def client(app_client, db_session):
     """Create a test client with database override."""
 
     def override_get_db():
@@ -47,19 +111,49 @@ def client(db_session):
         finally:
             pass
 
+    # Routes use either dependency; both must see the test's transaction
     app.dependency_overrides[get_db] = override_get_db
-    with TestClient(app) as test_client:
-        yield test_client
+    app.dependency_overrides[deps.get_db] = override_get_db
+    yield app_client
     app.dependency_overrides.clear()
+    app_client.cookies.clear()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def fast_password_hashing():
+    """Hash passwords with the minimum bcrypt cost factor during tests.
+
+    Hashes stay real bcrypt hashes, so verification behaves as in
+    production, but each takes about a millisecond instead of ~250 ms.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(bcrypt, "gensalt", partial(bcrypt.gensalt, rounds=4))
+        yield
+
+
+@pytest.fixture(scope="session")
+def password_hashes() -> dict[str, str]:
+    """Hash the fixture passwords once; bcrypt dominates user setup cost."""
+    return {
+        password: get_password_hash(password)
+        for password in ("testpassword123", "adminpassword123")
+    }
+
+
+def _login(client, db_session, user):
+    """Attach a freshly minted session cookie for user to client."""
+    token = auth_service.create_session(db_session, user.id)
+    client.cookies.set("session", token)
+    return client
 
 
 @pytest.fixture
-def test_user(db_session) -> User:
+def test_user(db_session, password_hashes) -> User:
     """Create a test user."""
     user = User(
         username="testuser",
         email="test@example.com",
-        hashed_password=get_password_hash("testpassword123"),
+        hashed_password=password_hashes["testpassword123"],
         is_admin=False,
         is_active=True,
     )
@@ -70,7 +164,7 @@ def test_user(db_session) -> User:
 
 
 @pytest.fixture
-def admin_user(db_session) -> User:
+def admin_user(db_session, password_hashes) -> User:
     """Create an admin test user with Global Admin role."""
     # Seed RBAC data (roles and permissions)
     seed_rbac_data(db_session)
@@ -79,7 +173,7 @@ def admin_user(db_session) -> User:
     user = User(
         username="admin",
         email="admin@example.com",
-        hashed_password=get_password_hash("adminpassword123"),
+        hashed_password=password_hashes["adminpassword123"],
         is_admin=True,
         is_active=True,
     )
@@ -99,21 +193,29 @@ def admin_user(db_session) -> User:
 
 
 @pytest.fixture
-def authenticated_client(client, test_user):
+def authenticated_client(client, db_session, test_user):
     """Create an authenticated test client."""
-    response = client.post(
-        "/api/v1/auth/login",
-        json={"username": "testuser", "password": "testpassword123"},
-    )
-    assert response.status_code == 200
-    return client
+    return _login(client, db_session, test_user)
 
 
 @pytest.fixture
-def admin_client(client, admin_user):
+def admin_client(client, db_session, admin_user):
     """Create an authenticated admin test client."""
-    response = client.post(
-        "/api/v1/auth/login", json={"username": "admin", "password": "adminpassword123"}
-    )
-    assert response.status_code == 200
-    return client
+    return _login(client, db_session, admin_user)
+
+
+@pytest.fixture
+def make_config(db_session):
+    """Factory for committed PluginConfigModel rows."""
+
+    def _make(plugin_id, *, version="1.0.0", settings=None, **overrides):
+        config = PluginConfigModel(
+            plugin_id=plugin_id, plugin_version=version, **overrides
+        )
+        if settings:
+            config.set_encrypted_settings(settings)
+        db_session.add(config)
+        db_session.commit()
+        return config
+
+    return _make
@@ -0,0 +1,80 @@
+# SPDX-FileCopyrightText: 2025 Roland Knall <rknall@gmail.com>
+# SPDX-License-Identifier: GPL-2.0-only
+"""Shared fixtures for integration tests."""
+
+import io
+import json
+import zipfile
+
+import pytest
+
+from src.plugins.loader import PLUGIN_MANIFEST_FILE
+
+PLUGIN_PY_BYTES = b"""
+from src.plugins.base import BasePlugin
+
+class TestPlugin(BasePlugin):
+    @classmethod
+    def get_config_schema(cls):
+        return {}
+
+    def get_router(self):
+        return None
+
+    def get_models(self):
+        return []
+
+    async def on_enable(self):
+        pass
+"""
+
+# Canonical plugin manifests, built into ZIPs once per session
+CANONICAL_MANIFESTS = {
+    "minimal": {
+        "id": "minimal-plugin",
+        "name": "Minimal Plugin",
+        "version": "1.0.0",
+        "description": "A minimal test plugin",
+    },
+    "full": {
+        "id": "full-plugin",
+        "name": "Full Plugin",
+        "version": "2.0.0",
+        "description": "A fully configured test plugin",
+        "author": "Test Author",
+        "homepage": "https://example.com",
+        "license": "MIT",
+        "capabilities": {"backend": True, "frontend": False, "config": True},
+        "permissions": {"required": ["user.read", "event.read"]},
+    },
+}
+
+PLUGIN_ZIPS_KEY = pytest.StashKey[dict[str, bytes]]()
+
+
+def _manifest_bytes(manifest_data: dict) -> bytes:
+    """Encode a manifest dict as compact JSON bytes."""
+    return json.dumps(manifest_data, separators=(",", ":")).encode()
+
+
+def create_plugin_zip(manifest_data: dict) -> bytes:
+    """Create a plugin ZIP file in memory."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_STORED) as zf:
+        zf.writestr(PLUGIN_MANIFEST_FILE, _manifest_bytes(manifest_data))
+        zf.writestr("backend/plugin.py", PLUGIN_PY_BYTES)
+    return buffer.getvalue()
+
+
+def pytest_configure(config):
+    """Prebuild the canonical plugin ZIPs once for the whole session."""
+    config.stash[PLUGIN_ZIPS_KEY] = {
+        name: create_plugin_zip(manifest)
+        for name, manifest in CANONICAL_MANIFESTS.items()
+    }
+
+
+@pytest.fixture
+def plugin_zips(request) -> dict[str, bytes]:
+    """Prebuilt canonical plugin ZIPs keyed by name ("minimal", "full")."""
+    return request.config.stash[PLUGIN_ZIPS_KEY]
@@ -2,45 +2,96 @@
 # SPDX-License-Identifier: GPL-2.0-only
 """Integration tests for plugin API endpoints."""
 
-import io
-import json
-import zipfile
-
+import orjson
 import pytest
 
-from src.models.plugin_config import PluginConfigModel
-from src.plugins.loader import PLUGIN_MANIFEST_FILE
 from src.plugins.registry import PluginRegistry
 
 
+def rjson(response):
+    """Decode a response body with orjson."""
+    return orjson.loads(response.content)
+
+
+FAKE_ZIP_UPLOAD = {"file": ("test.zip", b"fake", "application/zip")}
+
+# (method, path, request kwargs, client fixture, expected status)
+AUTH_MATRIX = [
+    ("GET", "/api/v1/plugins", {}, "client", 401),
+    ("GET", "/api/v1/plugins/{pid}", {}, "client", 401),
+    ("GET", "/api/v1/plugins/{pid}", {}, "authenticated_client", 404),
+    ("POST", "/api/v1/plugins/install", {"files": FAKE_ZIP_UPLOAD}, "client", 401),
+    (
+        "POST",
+        "/api/v1/plugins/install",
+        {"files": FAKE_ZIP_UPLOAD},
+        "authenticated_client",
+        403,
+    ),
+    ("DELETE", "/api/v1/plugins/{pid}", {}, "client", 401),
+    ("DELETE", "/api/v1/plugins/{pid}", {}, "authenticated_client", 403),
+    ("DELETE", "/api/v1/plugins/{pid}", {}, "admin_client", 404),
+    (
+        "PUT",
+        "/api/v1/plugins/{pid}/settings",
+        {"json": {"settings": {}}},
+        "client",
+        401,
+    ),
+    (
+        "PUT",
+        "/api/v1/plugins/{pid}/settings",
+        {"json": {"settings": {}}},
+        "authenticated_client",
+        403,
+    ),
+    (
+        "PUT",
+        "/api/v1/plugins/{pid}/settings",
+        {"json": {"settings": {"key": "value"}}},
+        "admin_client",
+        404,
+    ),
+]
+
+
+@pytest.fixture
+def reset_registry():
+    """Reset plugin registry around each test."""
+    PluginRegistry.reset_instance()
+    yield
+    PluginRegistry.reset_instance()
+
+
+@pytest.mark.parametrize(
+    ("method", "path", "kwargs", "client_fixture", "expected_status"),
+    AUTH_MATRIX,
+)
+def test_auth_matrix(request, method, path, kwargs, client_fixture, expected_status):
+    """Test authentication, admin and not-found responses across endpoints."""
+    client = request.getfixturevalue(client_fixture)
+    response = client.request(method, path.format(pid="nonexistent"), **kwargs)
+    assert response.status_code == expected_status
+
+
 class TestPluginListEndpoint:
     """Tests for GET /api/v1/plugins endpoint."""
 
-    def test_requires_authentication(self, client):
-        """Test that endpoint requires authentication."""
-        response = client.get("/api/v1/plugins")
-        assert response.status_code == 401
-
     def test_list_empty(self, authenticated_client):
         """Test listing plugins when none installed."""
         response = authenticated_client.get("/api/v1/plugins")
         assert response.status_code == 200
-        data = response.json()
+        data = rjson(response)
         assert data["plugins"] == []
 
-    def test_list_with_plugins(self, authenticated_client, db_session):
+    def test_list_with_plugins(self, authenticated_client, make_config):
         """Test listing installed plugins."""
         # Add a plugin config to database
-        config = PluginConfigModel(
-            plugin_id="test-plugin",
-            plugin_version="1.0.0",
-        )
-        db_session.add(config)
-        db_session.commit()
+        make_config("test-plugin")
 
         response = authenticated_client.get("/api/v1/plugins")
         assert response.status_code == 200
-        data = response.json()
+        data = rjson(response)
         assert len(data["plugins"]) == 1
         assert data["plugins"][0]["plugin_id"] == "test-plugin"
 
@@ -48,84 +99,28 @@ class TestPluginListEndpoint:
 class TestPluginDetailEndpoint:
     """Tests for GET /api/v1/plugins/{plugin_id} endpoint."""
 
-    def test_requires_authentication(self, client):
-        """Test that endpoint requires authentication."""
-        response = client.get("/api/v1/plugins/test-plugin")
-        assert response.status_code == 401
-
-    def test_not_found(self, authenticated_client):
-        """Test getting non-existent plugin."""
-        response = authenticated_client.get("/api/v1/plugins/nonexistent")
-        assert response.status_code == 404
-
-    def test_get_plugin_details(self, authenticated_client, db_session):
+    def test_get_plugin_details(self, authenticated_client, make_config):
         """Test getting plugin details."""
-        config = PluginConfigModel(
-            plugin_id="detail-plugin",
-            plugin_version="1.0.0",
-        )
-        config.set_encrypted_settings({"api_key": "secret"})
-        db_session.add(config)
-        db_session.commit()
+        make_config("detail-plugin", settings={"api_key": "secret"})
 
         response = authenticated_client.get("/api/v1/plugins/detail-plugin")
         assert response.status_code == 200
-        data = response.json()
+        data = rjson(response)
         assert data["plugin_id"] == "detail-plugin"
         assert data["plugin_version"] == "1.0.0"
         assert data["settings"]["api_key"] == "secret"
 
 
+@pytest.mark.usefixtures("reset_registry")
 class TestPluginInstallEndpoint:
     """Tests for POST /api/v1/plugins/install endpoint."""
 
-    @pytest.fixture(autouse=True)
-    def reset_registry(self):
-        """Reset plugin registry before each test."""
-        PluginRegistry.reset_instance()
-        yield
-        PluginRegistry.reset_instance()
-
-    def create_plugin_zip(self, plugin_id: str, manifest_data: dict) -> bytes:
-        """Create a plugin ZIP file in memory."""
-        buffer = io.BytesIO()
-        with zipfile.ZipFile(buffer, "w") as zf:
-            zf.writestr(PLUGIN_MANIFEST_FILE, json.dumps(manifest_data))
-            zf.writestr(
-                "backend/plugin.py",
-                """
-from src.plugins.base import BasePlugin
-
-class TestPlugin(BasePlugin):
-    @classmethod
-    def get_config_schema(cls):
-        return {}
-
-    def get_router(self):
-        return None
-
-    def get_models(self):
-        return []
-""",
-            )
-        buffer.seek(0)
-        return buffer.read()
-
-    def test_requires_authentication(self, client):
-        """Test that endpoint requires authentication."""
-        response = client.post(
-            "/api/v1/plugins/install",
-            files={"file": ("test.zip", b"fake", "application/zip")},
-        )
-        assert response.status_code == 401
-
-    def test_requires_admin(self, authenticated_client):
-        """Test that endpoint requires admin privileges."""
-        response = authenticated_client.post(
-            "/api/v1/plugins/install",
-            files={"file": ("test.zip", b"fake", "application/zip")},
-        )
-        assert response.status_code == 403
+    @pytest.fixture
+    def plugins_dir(self, tmp_path, monkeypatch):
+        """Install plugins into a temporary directory."""
+        plugins_dir = tmp_path / "plugins"
+        monkeypatch.setattr("src.plugins.loader.PLUGINS_DIR", plugins_dir)
+        return plugins_dir
 
     def test_rejects_non_zip(self, admin_client):
         """Test that non-ZIP files are rejected."""
@@ -134,7 +129,7 @@ class TestPlugin(BasePlugin):
             files={"file": ("test.txt", b"not a zip", "text/plain")},
         )
         assert response.status_code == 400
-        assert "ZIP" in response.json()["detail"]
+        assert "ZIP" in rjson(response)["detail"]
 
     def test_rejects_invalid_zip(self, admin_client):
         """Test that invalid ZIP files are rejected."""
@@ -144,91 +139,56 @@ class TestPlugin(BasePlugin):
         )
         assert response.status_code == 400
 
+    def test_install_plugin(self, plugins_dir, admin_client, plugin_zips):
+        """Test installing a plugin from a prebuilt ZIP."""
+        response = admin_client.post(
+            "/api/v1/plugins/install",
+            files={"file": ("plugin.zip", plugin_zips["full"], "application/zip")},
+        )
+        assert response.status_code == 200
+        data = rjson(response)
+        assert data["success"] is True
+        assert data["plugin_id"] == "full-plugin"
+        assert data["version"] == "2.0.0"
+        assert (plugins_dir / "full-plugin" / "backend" / "plugin.py").exists()
+
+    def test_install_existing_requires_upgrade(
+        self, plugins_dir, admin_client, plugin_zips
+    ):
+        """Test that reinstalling a plugin requires the upgrade flag."""
+        files = {"file": ("plugin.zip", plugin_zips["minimal"], "application/zip")}
+        response = admin_client.post("/api/v1/plugins/install", files=files)
+        assert response.status_code == 200
 
-class TestPluginUninstallEndpoint:
-    """Tests for DELETE /api/v1/plugins/{plugin_id} endpoint."""
-
-    @pytest.fixture(autouse=True)
-    def reset_registry(self):
-        """Reset plugin registry before each test."""
-        PluginRegistry.reset_instance()
-        yield
-        PluginRegistry.reset_instance()
-
-    def test_requires_authentication(self, client):
-        """Test that endpoint requires authentication."""
-        response = client.delete("/api/v1/plugins/test-plugin")
-        assert response.status_code == 401
-
-    def test_requires_admin(self, authenticated_client):
-        """Test that endpoint requires admin privileges."""
-        response = authenticated_client.delete("/api/v1/plugins/test-plugin")
-        assert response.status_code == 403
+        response = admin_client.post("/api/v1/plugins/install", files=files)
+        assert response.status_code == 400
+        assert "already installed" in rjson(response)["detail"]
 
-    def test_not_found(self, admin_client):
-        """Test uninstalling non-existent plugin."""
-        response = admin_client.delete("/api/v1/plugins/nonexistent")
-        assert response.status_code == 404
+        response = admin_client.post(
+            "/api/v1/plugins/install", params={"upgrade": True}, files=files
+        )
+        assert response.status_code == 200
+        assert "upgraded" in rjson(response)["message"]
 
 
+@pytest.mark.usefixtures("reset_registry")
 class TestPluginSettingsEndpoint:
     """Tests for PUT /api/v1/plugins/{plugin_id}/settings endpoint."""
 
-    @pytest.fixture(autouse=True)
-    def reset_registry(self):
-        """Reset plugin registry before each test."""
-        PluginRegistry.reset_instance()
-        yield
-        PluginRegistry.reset_instance()
-
-    def test_requires_authentication(self, client):
-        """Test that endpoint requires authentication."""
-        response = client.put(
-            "/api/v1/plugins/test-plugin/settings",
-            json={"settings": {}},
-        )
-        assert response.status_code == 401
-
-    def test_requires_admin(self, authenticated_client):
-        """Test that endpoint requires admin privileges."""
-        response = authenticated_client.put(
-            "/api/v1/plugins/test-plugin/settings",
-            json={"settings": {}},
-        )
-        assert response.status_code == 403
-
-    def test_not_found(self, admin_client):
-        """Test updating settings for non-existent plugin."""
-        response = admin_client.put(
-            "/api/v1/plugins/nonexistent/settings",
-            json={"settings": {"key": "value"}},
-        )
-        assert response.status_code == 404
-
-    def test_update_settings(self, admin_client, db_session):
+    def test_update_settings(self, admin_client, db_session, make_config):
         """Test updating plugin settings."""
-        config = PluginConfigModel(
-            plugin_id="settings-plugin",
-            plugin_version="1.0.0",
-        )
-        db_session.add(config)
-        db_session.commit()
+        config = make_config("settings-plugin")
 
         response = admin_client.put(
             "/api/v1/plugins/settings-plugin/settings",
             json={"settings": {"api_key": "new-key", "timeout": 60}},
         )
         assert response.status_code == 200
-        data = response.json()
+        data = rjson(response)
         assert data["success"] is True
 
-        # Verify settings were saved (need to refresh from DB)
-        db_session.expire_all()
-        updated_config = (
-            db_session.query(PluginConfigModel)
-            .filter(PluginConfigModel.plugin_id == "settings-plugin")
-            .first()
-        )
-        settings = updated_config.get_decrypted_settings()
+        # Verify settings were saved (reload the row from DB)
+        db_session.refresh(config)
+        settings = config.get_decrypted_settings()
         assert settings["api_key"] == "new-key"
         assert settings["timeout"] == 60
@@ -8,7 +8,7 @@ from cryptography.fernet import InvalidToken
 # Set test environment
 os.environ["SECRET_KEY"] = "test-secret-key-for-testing-only-32chars!"  # noqa: S105
 
-from src.encryption import decrypt_config, encrypt_config
+from src.encryption import decrypt_config, encrypt_config, get_fernet
 
 
 class TestEncryption:
@@ -84,3 +84,12 @@ class TestEncryption:
 
         with pytest.raises((InvalidToken, ValueError)):
             decrypt_config(tampered)
+
+    def test_fernet_instance_is_reused(self, monkeypatch):
+        """Test that the cipher is built once per secret key."""
+        assert get_fernet() is get_fernet()
+
+        encrypted = encrypt_config({"key": "value"})
+        monkeypatch.setattr("src.encryption.settings.secret_key", "another-key")
+        with pytest.raises(InvalidToken):
+            decrypt_config(encrypted)
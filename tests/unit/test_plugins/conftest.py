@@ -0,0 +1,29 @@
+# SPDX-FileCopyrightText: 2025 Roland Knall <rknall@gmail.com>
+# SPDX-License-Identifier: GPL-2.0-only
+"""Shared fixtures for plugin system unit tests."""
+
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from src.plugins.loader import PluginLoader
+
+
+@pytest.fixture(scope="session")
+def plugins_root(tmp_path_factory) -> Path:
+    """Session-wide parent directory for the per-test plugins directories."""
+    return tmp_path_factory.mktemp("plugins_root")
+
+
+@pytest.fixture
+def plugins_dir(plugins_root: Path) -> Path:
+    """Create an empty plugins directory for one test."""
+    # mkdtemp keeps names unique even when test names repeat across classes
+    return Path(tempfile.mkdtemp(prefix="plugins-", dir=plugins_root))
+
+
+@pytest.fixture
+def loader(plugins_dir: Path) -> PluginLoader:
+    """Create a PluginLoader for the test's plugins directory."""
+    return PluginLoader(plugins_dir)
@@ -2,6 +2,9 @@
 # SPDX-License-Identifier: GPL-2.0-only
 """Tests for plugin base classes and interfaces."""
 
+import asyncio
+from dataclasses import replace
+
 import pytest
 
 from src.plugins.base import (
@@ -12,61 +15,82 @@ from src.plugins.base import (
     PluginManifest,
 )
 
+FROZEN_READ = frozenset({Permission.USER_READ})
+FROZEN_RW = frozenset({Permission.USER_READ, Permission.EVENT_READ})
+FROZEN_READ_AND_WRITE = frozenset({Permission.USER_READ, Permission.EXPENSE_WRITE})
 
-class TestPluginCapability:
-    """Tests for PluginCapability enum."""
-
-    def test_capability_values(self):
-        """Test that all capability values are correct."""
-        assert PluginCapability.BACKEND.value == "backend"
-        assert PluginCapability.FRONTEND.value == "frontend"
-        assert PluginCapability.CONFIG.value == "config"
-
-    def test_capability_is_string_enum(self):
-        """Test that capabilities are string enums."""
-        assert isinstance(PluginCapability.BACKEND, str)
-        assert PluginCapability.BACKEND == "backend"
+# Baseline manifest; tests derive variants from it with dataclasses.replace
+BASE_MANIFEST = PluginManifest(
+    id="test-plugin",
+    name="Test Plugin",
+    version="1.0.0",
+    description="A test plugin",
+)
 
 
-class TestPermission:
-    """Tests for Permission enum."""
+def derive_manifest(**changes) -> PluginManifest:
+    """Derive a manifest from BASE_MANIFEST with its own mutable fields.
 
-    def test_user_permissions(self):
-        """Test user permission values."""
-        assert Permission.USER_READ.value == "user.read"
-        assert Permission.USER_WRITE_SELF.value == "user.write.self"
-        assert Permission.USER_WRITE_ALL.value == "user.write.all"
+    dataclasses.replace() copies field values as they are, so without fresh
+    containers every derived manifest would share BASE_MANIFEST's sets and
+    lists.
+    """
+    fresh = {
+        "capabilities": set(),
+        "required_permissions": set(),
+        "provided_permissions": [],
+        "dependencies": [],
+        "python_dependencies": [],
+    }
+    return replace(BASE_MANIFEST, **(fresh | changes))
 
-    def test_event_permissions(self):
-        """Test event permission values."""
-        assert Permission.EVENT_READ.value == "event.read"
-        assert Permission.EVENT_WRITE.value == "event.write"
-        assert Permission.EVENT_DELETE.value == "event.delete"
 
-    def test_company_permissions(self):
-        """Test company permission values."""
-        assert Permission.COMPANY_READ.value == "company.read"
-        assert Permission.COMPANY_WRITE.value == "company.write"
+class TestPluginCapability:
+    """Tests for PluginCapability enum."""
 
-    def test_expense_permissions(self):
-        """Test expense permission values."""
-        assert Permission.EXPENSE_READ.value == "expense.read"
-        assert Permission.EXPENSE_WRITE.value == "expense.write"
+    @pytest.mark.parametrize(
+        ("member", "value"),
+        [
+            (PluginCapability.BACKEND, "backend"),
+            (PluginCapability.FRONTEND, "frontend"),
+            (PluginCapability.CONFIG, "config"),
+        ],
+    )
+    def test_capability_values(self, member, value):
+        """Test that capabilities are string enums with the correct values."""
+        assert member.value == value
+        assert isinstance(member, str)
+        assert member == value
 
-    def test_calendar_permissions(self):
-        """Test calendar permission values."""
-        assert Permission.CALENDAR_READ.value == "calendar.read"
-        assert Permission.CALENDAR_WRITE.value == "calendar.write"
 
-    def test_integration_permissions(self):
-        """Test integration permission values."""
-        assert Permission.INTEGRATION_USE.value == "integration.use"
-        assert Permission.INTEGRATION_CONFIG.value == "integration.config"
+class TestPermission:
+    """Tests for Permission enum."""
 
-    def test_system_permissions(self):
-        """Test system permission values."""
-        assert Permission.SYSTEM_SETTINGS_READ.value == "system.settings.read"
-        assert Permission.SYSTEM_SETTINGS_WRITE.value == "system.settings.write"
+    @pytest.mark.parametrize(
+        ("member", "value"),
+        [
+            (Permission.USER_READ, "user.read"),
+            (Permission.USER_WRITE_SELF, "user.write.self"),
+            (Permission.USER_WRITE_ALL, "user.write.all"),
+            (Permission.EVENT_READ, "event.read"),
+            (Permission.EVENT_WRITE, "event.write"),
+            (Permission.EVENT_DELETE, "event.delete"),
+            (Permission.COMPANY_READ, "company.read"),
+            (Permission.COMPANY_WRITE, "company.write"),
+            (Permission.EXPENSE_READ, "expense.read"),
+            (Permission.EXPENSE_WRITE, "expense.write"),
+            (Permission.CALENDAR_READ, "calendar.read"),
+            (Permission.CALENDAR_WRITE, "calendar.write"),
+            (Permission.INTEGRATION_USE, "integration.use"),
+            (Permission.INTEGRATION_CONFIG, "integration.config"),
+            (Permission.SYSTEM_SETTINGS_READ, "system.settings.read"),
+            (Permission.SYSTEM_SETTINGS_WRITE, "system.settings.write"),
+        ],
+    )
+    def test_permission_values(self, member, value):
+        """Test that permissions are string enums with the correct values."""
+        assert member.value == value
+        assert isinstance(member, str)
 
 
 class TestPluginManifest:
@@ -97,7 +121,7 @@ class TestPluginManifest:
 
     def test_create_full_manifest(self):
         """Test creating a manifest with all fields."""
-        manifest = PluginManifest(
+        manifest = derive_manifest(
             id="full-plugin",
             name="Full Plugin",
             version="2.0.0",
@@ -122,6 +146,17 @@ class TestPluginManifest:
         assert Permission.USER_READ in manifest.permissions  # property alias
         assert "other-plugin" in manifest.dependencies
 
+    def test_derived_manifests_do_not_share_containers(self):
+        """Test that changing one derived manifest leaves the others alone."""
+        first = derive_manifest()
+        first.capabilities.add(PluginCapability.BACKEND)
+        first.dependencies.append("other-plugin")
+
+        second = derive_manifest()
+        assert second.capabilities == set()
+        assert second.dependencies == []
+        assert BASE_MANIFEST.capabilities == set()
+
 
 class TestPluginConfig:
     """Tests for PluginConfig dataclass."""
@@ -160,25 +195,24 @@ class ConcretePlugin(BasePlugin):
 
 
 class TestBasePlugin:
-    """Tests for BasePlugin abstract class."""
+    """Tests for BasePlugin abstract class.
 
-    @pytest.fixture
+    The fixtures are class-scoped since no test mutates the plugin instance.
+    """
+
+    @pytest.fixture(scope="class")
     def manifest(self):
         """Create a test manifest."""
-        return PluginManifest(
-            id="test-plugin",
-            name="Test Plugin",
-            version="1.0.0",
-            description="A test plugin",
+        return derive_manifest(
             required_permissions={Permission.USER_READ, Permission.EVENT_READ},
         )
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def config(self):
         """Create a test config."""
         return PluginConfig(settings={"key": "value"})
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def plugin(self, manifest, config):
         """Create a test plugin instance."""
         return ConcretePlugin(manifest, config, "/path/to/plugin")
@@ -233,25 +267,24 @@ class TestBasePlugin:
         assert plugin.has_permission(Permission.USER_WRITE_ALL) is False
         assert plugin.has_permission(Permission.EXPENSE_WRITE) is False
 
-    def test_has_all_permissions_true(self, plugin):
-        """Test has_all_permissions returns True when all granted."""
-        assert plugin.has_all_permissions({Permission.USER_READ}) is True
-        assert (
-            plugin.has_all_permissions({Permission.USER_READ, Permission.EVENT_READ})
-            is True
-        )
-
-    def test_has_all_permissions_false(self, plugin):
-        """Test has_all_permissions returns False when some missing."""
-        assert (
-            plugin.has_all_permissions({Permission.USER_READ, Permission.EXPENSE_WRITE})
-            is False
-        )
+    @pytest.mark.parametrize(
+        ("permissions", "expected"),
+        [
+            (FROZEN_READ, True),
+            (FROZEN_RW, True),
+            (FROZEN_READ_AND_WRITE, False),
+        ],
+    )
+    def test_has_all_permissions(self, plugin, permissions, expected):
+        """Test has_all_permissions is True only when all are granted."""
+        assert plugin.has_all_permissions(permissions) is expected
 
     @pytest.mark.asyncio
     async def test_lifecycle_hooks_are_async(self, plugin):
         """Test that lifecycle hooks are async and can be awaited."""
         # These should not raise
-        await plugin.on_install()
-        await plugin.on_uninstall()
-        await plugin.on_upgrade("0.9.0")
+        await asyncio.gather(
+            plugin.on_install(),
+            plugin.on_uninstall(),
+            plugin.on_upgrade("0.9.0"),
+        )
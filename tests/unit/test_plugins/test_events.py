@@ -2,7 +2,10 @@
 # SPDX-License-Identifier: GPL-2.0-only
 """Tests for plugin event bus system."""
 
-from datetime import datetime
+import asyncio
+import sys
+from dataclasses import FrozenInstanceError
+from datetime import UTC, datetime, timedelta
 
 import pytest
 
@@ -62,7 +65,7 @@ class TestEventPayload:
 
     def test_create_payload(self):
         """Test creating an event payload."""
-        now = datetime.utcnow()
+        now = datetime.now(UTC)
         payload = EventPayload(
             event_type=AppEvent.USER_CREATED,
             timestamp=now,
@@ -77,12 +80,56 @@ class TestEventPayload:
         """Test creating an event payload with source plugin."""
         payload = EventPayload(
             event_type=AppEvent.EVENT_CREATED,
-            timestamp=datetime.utcnow(),
+            timestamp=datetime.now(UTC),
             data={"event_id": "456"},
             source_plugin_id="my-plugin",
         )
         assert payload.source_plugin_id == "my-plugin"
 
+    def test_source_plugin_id_is_interned(self):
+        """Test that payloads for the same plugin share one ID string."""
+        plugin_id = "".join(["my-", "plugin"])
+        payload = EventPayload(
+            event_type=AppEvent.EVENT_CREATED,
+            data={},
+            source_plugin_id=plugin_id,
+        )
+        assert payload.source_plugin_id is sys.intern("my-plugin")
+
+    def test_payload_is_frozen(self):
+        """Test that payload fields cannot be reassigned by handlers."""
+        payload = EventPayload(event_type=AppEvent.USER_LOGIN, data={})
+        with pytest.raises(FrozenInstanceError):
+            payload.source_plugin_id = "other-plugin"
+
+    def test_create_payload_from_timestamp_ns(self):
+        """Test that the timestamp is derived from nanoseconds on access."""
+        payload = EventPayload(
+            event_type=AppEvent.USER_LOGIN,
+            data={},
+            timestamp_ns=1_700_000_000_123_456_789,
+        )
+        assert payload.timestamp == datetime(
+            2023, 11, 14, 22, 13, 20, 123456, tzinfo=UTC
+        )
+
+    def test_naive_timestamp_is_utc(self):
+        """Test that naive timestamps are interpreted as UTC."""
+        payload = EventPayload(
+            event_type=AppEvent.USER_LOGIN,
+            timestamp=datetime(2025, 1, 15, 10, 30),
+            data={},
+        )
+        assert payload.timestamp == datetime(2025, 1, 15, 10, 30, tzinfo=UTC)
+        assert payload.timestamp.tzinfo is UTC
+
+    def test_create_payload_defaults_to_now(self):
+        """Test that a payload without a timestamp is stamped with now."""
+        before = datetime.now(UTC)
+        payload = EventPayload(event_type=AppEvent.USER_LOGIN, data={})
+        assert before - timedelta(seconds=1) <= payload.timestamp
+        assert payload.timestamp <= datetime.now(UTC)
+
 
 class TestEventBus:
     """Tests for EventBus class."""
@@ -124,6 +171,27 @@ class TestEventBus:
         event_bus.subscribe(AppEvent.USER_CREATED, handler2, "plugin-2")
         assert event_bus.get_subscriber_count(AppEvent.USER_CREATED) == 2
 
+    @pytest.mark.asyncio
+    async def test_string_event_types(self, event_bus):
+        """Test that events can be given by their string value."""
+        received = []
+
+        def handler(payload):
+            received.append(payload)
+
+        event_bus.subscribe("user.created", handler, "test-plugin")
+        assert event_bus.get_subscriber_count(AppEvent.USER_CREATED) == 1
+
+        await event_bus.publish("user.created", {"user_id": "123"})
+
+        assert received[0].event_type is AppEvent.USER_CREATED
+        assert event_bus.get_subscribed_events("test-plugin") == [AppEvent.USER_CREATED]
+
+    def test_unknown_event_type(self, event_bus):
+        """Test that unknown event names are rejected."""
+        with pytest.raises(ValueError, match="Unknown event type"):
+            event_bus.subscribe("no.such.event", lambda payload: None)
+
     def test_unsubscribe_handler(self, event_bus):
         """Test unsubscribing a handler."""
 
@@ -136,6 +204,40 @@ class TestEventBus:
         event_bus.unsubscribe(AppEvent.USER_CREATED, handler, "test-plugin")
         assert event_bus.get_subscriber_count(AppEvent.USER_CREATED) == 0
 
+    def test_unsubscribe_bound_method(self, event_bus):
+        """Test unsubscribing a bound method passed as a fresh attribute."""
+
+        class Listener:
+            def on_event(self, payload):
+                pass
+
+        listener = Listener()
+        event_bus.subscribe(AppEvent.USER_CREATED, listener.on_event, "test-plugin")
+        event_bus.unsubscribe(AppEvent.USER_CREATED, listener.on_event, "test-plugin")
+
+        assert event_bus.get_subscriber_count(AppEvent.USER_CREATED) == 0
+        assert event_bus.get_subscribed_events("test-plugin") == []
+
+    @pytest.mark.asyncio
+    async def test_subscribe_same_handler_twice(self, event_bus):
+        """Test that a handler subscribed twice is called twice until removed."""
+        calls = []
+
+        def handler(payload):
+            calls.append(payload)
+
+        event_bus.subscribe(AppEvent.USER_CREATED, handler, "test-plugin")
+        event_bus.subscribe(AppEvent.USER_CREATED, handler, "test-plugin")
+        await event_bus.publish(AppEvent.USER_CREATED, {})
+
+        assert event_bus.get_subscriber_count(AppEvent.USER_CREATED) == 2
+        assert len(calls) == 2
+
+        event_bus.unsubscribe(AppEvent.USER_CREATED, handler, "test-plugin")
+
+        assert event_bus.get_subscriber_count(AppEvent.USER_CREATED) == 1
+        assert event_bus.get_subscribed_events("test-plugin") == [AppEvent.USER_CREATED]
+
     def test_unsubscribe_plugin(self, event_bus):
         """Test unsubscribing all handlers for a plugin."""
 
@@ -224,6 +326,48 @@ class TestEventBus:
 
         assert received[0].source_plugin_id == "source-plugin"
 
+    @pytest.mark.asyncio
+    async def test_cascaded_publish_inherits_source_plugin(self, event_bus):
+        """Test that events published by a handler are attributed to its plugin."""
+        received = []
+
+        async def on_user_created(payload):
+            await event_bus.publish(AppEvent.EVENT_CREATED, {"event_id": "1"})
+
+        def on_event_created(payload):
+            event_bus.publish_sync(AppEvent.COMPANY_CREATED, {"company_id": "2"})
+            received.append(payload)
+
+        def on_company_created(payload):
+            received.append(payload)
+
+        event_bus.subscribe(AppEvent.USER_CREATED, on_user_created, "plugin-1")
+        event_bus.subscribe(AppEvent.EVENT_CREATED, on_event_created, "plugin-2")
+        event_bus.subscribe(AppEvent.COMPANY_CREATED, on_company_created, "plugin-3")
+
+        await event_bus.publish(AppEvent.USER_CREATED, {"user_id": "123"})
+
+        assert [p.source_plugin_id for p in received] == ["plugin-2", "plugin-1"]
+
+    @pytest.mark.asyncio
+    async def test_single_async_handler_does_not_leak_source(self, event_bus):
+        """Test that awaiting a lone async handler restores the caller context."""
+        received = []
+
+        async def handler(payload):
+            pass
+
+        def host_handler(payload):
+            received.append(payload)
+
+        event_bus.subscribe(AppEvent.USER_CREATED, handler, "plugin-1")
+        event_bus.subscribe(AppEvent.EVENT_CREATED, host_handler)
+
+        await event_bus.publish(AppEvent.USER_CREATED, {})
+        await event_bus.publish(AppEvent.EVENT_CREATED, {})
+
+        assert received[0].source_plugin_id is None
+
     @pytest.mark.asyncio
     async def test_publish_handler_error_does_not_stop_others(self, event_bus):
         """Test that one handler error doesn't stop other handlers."""
@@ -243,6 +387,155 @@ class TestEventBus:
 
         assert len(received) == 1
 
+    @pytest.mark.asyncio
+    async def test_publish_async_handler_error_does_not_stop_others(self, event_bus):
+        """Test that one async handler error doesn't stop other handlers."""
+        received = []
+
+        async def failing_handler(payload):
+            raise ValueError("Handler failed")
+
+        async def working_handler(payload):
+            received.append(payload)
+
+        event_bus.subscribe(AppEvent.USER_CREATED, failing_handler, "plugin-1")
+        event_bus.subscribe(AppEvent.USER_CREATED, working_handler, "plugin-2")
+
+        await event_bus.publish(AppEvent.USER_CREATED, {"test": "data"})
+
+        assert len(received) == 1
+
+    @pytest.mark.asyncio
+    async def test_publish_runs_async_handlers_concurrently(self, event_bus):
+        """Test that async handlers are awaited together, not one by one."""
+        first_started = asyncio.Event()
+
+        async def waiting_handler(payload):
+            # Would never finish if handlers were awaited sequentially
+            await first_started.wait()
+
+        async def signalling_handler(payload):
+            first_started.set()
+
+        event_bus.subscribe(AppEvent.USER_CREATED, waiting_handler)
+        event_bus.subscribe(AppEvent.USER_CREATED, signalling_handler)
+
+        await asyncio.wait_for(
+            event_bus.publish(AppEvent.USER_CREATED, {"test": "data"}), timeout=1
+        )
+
+    @pytest.mark.asyncio
+    async def test_publish_nowait(self, event_bus):
+        """Test that publish_nowait returns before async handlers finish."""
+        sync_received = []
+        async_received = []
+        release = asyncio.Event()
+
+        def sync_handler(payload):
+            sync_received.append(payload)
+
+        async def slow_handler(payload):
+            await release.wait()
+            async_received.append(payload)
+
+        event_bus.subscribe(AppEvent.USER_CREATED, sync_handler)
+        event_bus.subscribe(AppEvent.USER_CREATED, slow_handler)
+
+        event_bus.publish_nowait(AppEvent.USER_CREATED, {"user_id": "123"})
+
+        assert len(sync_received) == 1
+        assert async_received == []
+
+        release.set()
+        for _ in range(3):
+            await asyncio.sleep(0)
+
+        assert len(async_received) == 1
+        assert async_received[0].data["user_id"] == "123"
+
+    @pytest.mark.asyncio
+    async def test_publish_many(self, event_bus):
+        """Test publishing a batch of events."""
+        sync_received = []
+        async_received = []
+
+        def sync_handler(payload):
+            sync_received.append(payload)
+
+        async def async_handler(payload):
+            async_received.append(payload)
+
+        event_bus.subscribe(AppEvent.USER_CREATED, sync_handler)
+        event_bus.subscribe(AppEvent.EVENT_CREATED, async_handler)
+
+        await event_bus.publish_many(
+            [
+                (AppEvent.USER_CREATED, {"user_id": "1"}),
+                (AppEvent.EVENT_CREATED, {"event_id": "2"}),
+                (AppEvent.USER_CREATED, {"user_id": "3"}),
+                (AppEvent.COMPANY_CREATED, {"company_id": "4"}),
+            ],
+            source_plugin_id="source-plugin",
+        )
+
+        assert [p.data["user_id"] for p in sync_received] == ["1", "3"]
+        assert [p.data["event_id"] for p in async_received] == ["2"]
+        payloads = sync_received + async_received
+        assert {p.timestamp_ns for p in payloads} == {payloads[0].timestamp_ns}
+        assert {p.source_plugin_id for p in payloads} == {"source-plugin"}
+
+    def test_publish_nowait_requires_running_loop(self, event_bus):
+        """Test that publish_nowait can't be used from plain sync code."""
+        with pytest.raises(RuntimeError):
+            event_bus.publish_nowait(AppEvent.USER_CREATED, {})
+
+    def test_unsubscribe_during_publish(self, event_bus):
+        """Test that a handler unsubscribing itself doesn't skip the next one."""
+        received = []
+
+        def one_shot_handler(payload):
+            event_bus.unsubscribe(AppEvent.USER_CREATED, one_shot_handler)
+            received.append("one-shot")
+
+        def regular_handler(payload):
+            received.append("regular")
+
+        event_bus.subscribe(AppEvent.USER_CREATED, one_shot_handler)
+        event_bus.subscribe(AppEvent.USER_CREATED, regular_handler)
+
+        event_bus.publish_sync(AppEvent.USER_CREATED, {})
+        event_bus.publish_sync(AppEvent.USER_CREATED, {})
+
+        assert received == ["one-shot", "regular", "regular"]
+
+    def test_publish_without_subscribers_skips_payload(self, event_bus, monkeypatch):
+        """Test that no payload is built when nobody is subscribed."""
+
+        def fail(*args, **kwargs):
+            raise AssertionError("EventPayload should not be constructed")
+
+        monkeypatch.setattr("src.plugins.events.EventPayload", fail)
+
+        event_bus.publish_sync(AppEvent.USER_CREATED, {"test": "data"})
+
+    def test_subscribe_during_publish(self, event_bus):
+        """Test that a handler subscribed mid-dispatch only sees later events."""
+        received = []
+
+        def late_handler(payload):
+            received.append(("late", payload.data["n"]))
+
+        def subscribing_handler(payload):
+            event_bus.subscribe(AppEvent.USER_CREATED, late_handler)
+            received.append(("first", payload.data["n"]))
+
+        event_bus.subscribe(AppEvent.USER_CREATED, subscribing_handler)
+
+        event_bus.publish_sync(AppEvent.USER_CREATED, {"n": 1})
+        event_bus.publish_sync(AppEvent.USER_CREATED, {"n": 2})
+
+        assert received == [("first", 1), ("first", 2), ("late", 2)]
+
     def test_publish_sync(self, event_bus):
         """Test synchronous publish."""
         received = []
@@ -297,6 +590,23 @@ class TestEventBus:
         assert AppEvent.EVENT_CREATED in events
         assert len(events) == 2
 
+    def test_get_subscribed_events_after_unsubscribe(self, event_bus):
+        """Test that unsubscribing drops the event from the plugin's list."""
+
+        def handler(payload):
+            pass
+
+        event_bus.subscribe(AppEvent.USER_CREATED, handler, "test-plugin")
+        event_bus.subscribe(AppEvent.EVENT_CREATED, handler, "test-plugin")
+
+        event_bus.unsubscribe(AppEvent.USER_CREATED, handler, "test-plugin")
+        assert event_bus.get_subscribed_events("test-plugin") == [
+            AppEvent.EVENT_CREATED
+        ]
+
+        event_bus.unsubscribe_plugin("test-plugin")
+        assert event_bus.get_subscribed_events("test-plugin") == []
+
     def test_get_subscribed_events_empty(self, event_bus):
         """Test getting events for plugin with no subscriptions."""
         events = event_bus.get_subscribed_events("nonexistent-plugin")
@@ -2,7 +2,9 @@
 # SPDX-License-Identifier: GPL-2.0-only
 """Tests for plugin loader."""
 
+import io
 import json
+import os
 import zipfile
 from pathlib import Path
 
@@ -10,7 +12,9 @@ import pytest
 
 from src.plugins.base import Permission, PluginCapability, PluginConfig, PluginManifest
 from src.plugins.loader import (
+    PLUGIN_INDEX_FILE,
     PLUGIN_MANIFEST_FILE,
+    PluginLayout,
     PluginLoader,
     PluginLoadError,
     PluginValidationError,
@@ -23,10 +27,10 @@ from src.plugins.loader import (
 class TestParseManifest:
     """Tests for parse_manifest function."""
 
-    @pytest.fixture
-    def manifest_dir(self, tmp_path):
-        """Create a temporary directory for manifest files."""
-        return tmp_path
+    @pytest.fixture(scope="class")
+    def manifest_dir(self, tmp_path_factory):
+        """Create one directory for the class; each test rewrites the manifest."""
+        return tmp_path_factory.mktemp("manifests")
 
     def write_manifest(self, path: Path, data: dict):
         """Helper to write manifest JSON."""
@@ -104,7 +108,9 @@ class TestParseManifest:
             # Missing version and description
         })
 
-        with pytest.raises(PluginValidationError, match="Missing required field"):
+        with pytest.raises(
+            PluginValidationError, match="Missing required field: version"
+        ):
             parse_manifest(manifest_path)
 
     def test_parse_empty_plugin_id(self, manifest_dir):
@@ -153,7 +159,7 @@ class TestParseManifest:
 
     def test_parse_nonexistent_file(self, manifest_dir):
         """Test that nonexistent file raises error."""
-        manifest_path = manifest_dir / PLUGIN_MANIFEST_FILE
+        manifest_path = manifest_dir / "missing.json"
 
         with pytest.raises(PluginValidationError, match="Could not read"):
             parse_manifest(manifest_path)
@@ -175,6 +181,65 @@ class TestParseManifest:
         # Unknown capability should be ignored (only valid ones in set)
         assert len(manifest.capabilities) == 1
 
+    def test_parse_caches_unchanged_manifest(self, manifest_dir, monkeypatch):
+        """Test that an unchanged manifest is parsed only once."""
+        data = {
+            "id": "cached-plugin",
+            "name": "Test",
+            "version": "1.0.0",
+            "description": "Test",
+        }
+        manifest_path = self.write_manifest(manifest_dir, data)
+        os.utime(manifest_path, ns=(1_000_000_000_000_000_000,) * 2)
+
+        first = parse_manifest(manifest_path)
+
+        def no_decode(raw):
+            raise AssertionError("manifest was re-read")
+
+        monkeypatch.setattr("src.plugins.loader._decode_manifest", no_decode)
+        assert parse_manifest(manifest_path) == first
+        monkeypatch.undo()
+
+        # Rewriting the file changes its stat signature and invalidates it
+        self.write_manifest(manifest_dir, {**data, "version": "1.0.1"})
+        os.utime(manifest_path, ns=(1_000_000_001_000_000_000,) * 2)
+        assert parse_manifest(manifest_path).version == "1.0.1"
+
+    def test_parse_cached_manifest_returns_copies(self, manifest_dir):
+        """Test that changing a returned manifest does not alter the cache."""
+        manifest_path = self.write_manifest(manifest_dir, {
+            "id": "copied-plugin",
+            "name": "Test",
+            "version": "1.0.0",
+            "description": "Test",
+            "permissions": ["user.read"],
+            "dependencies": ["other-plugin"],
+        })
+        os.utime(manifest_path, ns=(1_000_000_000_000_000_000,) * 2)
+
+        first = parse_manifest(manifest_path)
+        first.required_permissions.add(Permission.USER_WRITE_ALL)
+        first.dependencies.append("injected")
+
+        second = parse_manifest(manifest_path)
+        assert second.required_permissions == {Permission.USER_READ}
+        assert second.dependencies == ["other-plugin"]
+
+    def test_parse_recently_modified_manifest_not_cached(self, manifest_dir):
+        """Test that a freshly written manifest is always re-read."""
+        data = {"id": "fresh-a", "name": "Test", "version": "1.0.0"}
+        manifest_path = self.write_manifest(
+            manifest_dir, {**data, "description": "Test"}
+        )
+        assert parse_manifest(manifest_path).id == "fresh-a"
+
+        # Same size, possibly same mtime tick: must not hit a stale entry
+        self.write_manifest(
+            manifest_dir, {**data, "id": "fresh-b", "description": "Test"}
+        )
+        assert parse_manifest(manifest_path).id == "fresh-b"
+
     def test_parse_unknown_permission_ignored(self, manifest_dir):
         """Test that unknown permissions are ignored but valid ones kept."""
         manifest_path = self.write_manifest(manifest_dir, {
@@ -196,18 +261,6 @@ class TestParseManifest:
 class TestPluginLoader:
     """Tests for PluginLoader class."""
 
-    @pytest.fixture
-    def plugins_dir(self, tmp_path):
-        """Create a temporary plugins directory."""
-        plugins = tmp_path / "plugins"
-        plugins.mkdir()
-        return plugins
-
-    @pytest.fixture
-    def loader(self, plugins_dir):
-        """Create a PluginLoader instance."""
-        return PluginLoader(plugins_dir)
-
     def create_plugin_structure(
         self, plugins_dir: Path, plugin_id: str, manifest_data: dict
     ) -> Path:
@@ -271,6 +324,92 @@ class TestPlugin(BasePlugin):
         assert manifest.id == "test-plugin"
         assert path == plugins_dir / "test-plugin"
 
+    def test_discover_plugins_many_sorted(self, loader, plugins_dir):
+        """Test that discovery returns every valid plugin ordered by name."""
+        plugin_ids = [f"plugin-{i:02d}" for i in range(12)]
+        for plugin_id in reversed(plugin_ids):
+            self.create_plugin_structure(plugins_dir, plugin_id, {
+                "id": plugin_id,
+                "name": plugin_id,
+                "version": "1.0.0",
+                "description": "One of many",
+            })
+        (plugins_dir / "broken").mkdir()
+        (plugins_dir / "broken" / PLUGIN_MANIFEST_FILE).write_text("{")
+
+        discovered = loader.discover_plugins()
+
+        assert [manifest.id for _, manifest in discovered] == plugin_ids
+        assert all(path.name == m.id for path, m in discovered)
+
+    def test_iter_plugins_is_lazy(self, loader, plugins_dir, monkeypatch):
+        """Test that iter_plugins parses manifests only as far as iterated."""
+        for plugin_id in ("alpha", "beta", "gamma"):
+            self.create_plugin_structure(plugins_dir, plugin_id, {
+                "id": plugin_id,
+                "name": plugin_id,
+                "version": "1.0.0",
+                "description": "Test",
+            })
+        parsed = []
+        real_read = loader._read_manifest
+
+        def tracking_read(plugin_dir):
+            parsed.append(Path(plugin_dir).name)
+            return real_read(plugin_dir)
+
+        monkeypatch.setattr(loader, "_read_manifest", tracking_read)
+
+        path, manifest = next(loader.iter_plugins())
+
+        assert (path.name, manifest.id) == ("alpha", "alpha")
+        assert parsed == ["alpha"]
+
+    def test_discover_plugins_uses_index(self, loader, plugins_dir, monkeypatch):
+        """Test that a warm start rebuilds unchanged manifests from the index."""
+        plugin_dir = self.create_plugin_structure(plugins_dir, "indexed", {
+            "id": "indexed",
+            "name": "Indexed",
+            "version": "1.0.0",
+            "description": "Test",
+        })
+        manifest_path = plugin_dir / PLUGIN_MANIFEST_FILE
+        os.utime(manifest_path, ns=(1_000_000_000_000_000_000,) * 2)
+        assert [m.id for _, m in loader.discover_plugins()] == ["indexed"]
+        assert (plugins_dir / PLUGIN_INDEX_FILE).exists()
+
+        def no_decode(raw):
+            raise AssertionError("manifest was re-read")
+
+        monkeypatch.setattr("src.plugins.loader._decode_manifest", no_decode)
+        discovered = PluginLoader(plugins_dir).discover_plugins()
+        assert [m.version for _, m in discovered] == ["1.0.0"]
+
+        # A changed manifest no longer matches its entry and is re-read
+        monkeypatch.undo()
+        manifest_path.write_text(json.dumps({
+            "id": "indexed",
+            "name": "Indexed",
+            "version": "1.1.0",
+            "description": "Test",
+        }))
+        discovered = PluginLoader(plugins_dir).discover_plugins()
+        assert [m.version for _, m in discovered] == ["1.1.0"]
+
+    def test_discover_plugins_ignores_corrupt_index(self, loader, plugins_dir):
+        """Test that an unreadable index is treated as empty."""
+        self.create_plugin_structure(plugins_dir, "test-plugin", {
+            "id": "test-plugin",
+            "name": "Test",
+            "version": "1.0.0",
+            "description": "Test",
+        })
+        index_path = plugins_dir / PLUGIN_INDEX_FILE
+        index_path.parent.mkdir()
+        index_path.write_text("not json {")
+
+        assert [m.id for _, m in loader.discover_plugins()] == ["test-plugin"]
+
     def test_discover_plugins_skips_hidden(self, loader, plugins_dir):
         """Test that discovery skips hidden directories."""
         # Create hidden directory with valid plugin
@@ -303,6 +442,18 @@ class TestPlugin(BasePlugin):
         # Directory without manifest should be skipped
         assert len(discovered) == 0
 
+    def test_discover_plugins_skips_files(self, loader, plugins_dir):
+        """Test that discovery ignores plain files in the plugins directory."""
+        (plugins_dir / "README.md").write_text("not a plugin")
+
+        assert loader.discover_plugins() == []
+
+    def test_discover_plugins_missing_dir(self, loader, plugins_dir):
+        """Test that discovery returns nothing if the directory was removed."""
+        plugins_dir.rmdir()
+
+        assert loader.discover_plugins() == []
+
     def test_get_plugin_path_exists(self, loader, plugins_dir):
         """Test getting path for existing plugin."""
         self.create_plugin_structure(plugins_dir, "test-plugin", {
@@ -364,6 +515,31 @@ class TestPlugin(BasePlugin):
 
         assert loader.has_backend("no-backend") is False
 
+    def test_discover_plugins_with_layout(self, loader, plugins_dir):
+        """Test that layout discovery matches has_frontend/has_backend."""
+        full_dir = self.create_plugin_structure(plugins_dir, "full", {
+            "id": "full",
+            "name": "Full",
+            "version": "1.0.0",
+            "description": "Test",
+        })
+        (full_dir / "frontend").mkdir()
+        (full_dir / "frontend" / "index.js").write_text("// Frontend code")
+        (plugins_dir / "bare").mkdir()
+        (plugins_dir / "bare" / PLUGIN_MANIFEST_FILE).write_text(json.dumps({
+            "id": "bare",
+            "name": "Bare",
+            "version": "1.0.0",
+            "description": "Test",
+        }))
+
+        discovered = loader.discover_plugins_with_layout()
+
+        assert [(path.name, layout) for path, _, layout in discovered] == [
+            ("bare", PluginLayout(has_frontend=False, has_backend=False)),
+            ("full", PluginLayout(has_frontend=True, has_backend=True)),
+        ]
+
     def test_uninstall_removes_directory(self, loader, plugins_dir):
         """Test that uninstall removes plugin directory."""
         self.create_plugin_structure(plugins_dir, "test-plugin", {
@@ -390,27 +566,11 @@ class TestPlugin(BasePlugin):
 class TestPluginLoaderZipInstall:
     """Tests for ZIP installation functionality."""
 
-    @pytest.fixture
-    def plugins_dir(self, tmp_path):
-        """Create a temporary plugins directory."""
-        plugins = tmp_path / "plugins"
-        plugins.mkdir()
-        return plugins
-
-    @pytest.fixture
-    def loader(self, plugins_dir):
-        """Create a PluginLoader instance."""
-        return PluginLoader(plugins_dir)
-
-    def create_plugin_zip(self, tmp_path: Path, plugin_id: str, manifest_data: dict):
-        """Helper to create a plugin ZIP file."""
-        zip_path = tmp_path / f"{plugin_id}.zip"
-
-        with zipfile.ZipFile(zip_path, "w") as zf:
-            # Add manifest
-            zf.writestr(PLUGIN_MANIFEST_FILE, json.dumps(manifest_data))
-
-            # Add backend plugin.py
+    @pytest.fixture(scope="class")
+    def zip_template(self) -> bytes:
+        """Build the shared archive body (backend/plugin.py) once per class."""
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as zf:
             zf.writestr("backend/plugin.py", """
 from src.plugins.base import BasePlugin
 
@@ -425,12 +585,24 @@ class TestPlugin(BasePlugin):
     def get_models(self):
         return []
 """)
+        return buffer.getvalue()
 
-        return zip_path
+    @pytest.fixture
+    def make_plugin_zip(self, tmp_path, zip_template):
+        """Factory for plugin ZIPs: the template plus a per-test manifest."""
+
+        def _make(plugin_id: str, manifest_data: dict) -> Path:
+            zip_path = tmp_path / f"{plugin_id}.zip"
+            zip_path.write_bytes(zip_template)
+            with zipfile.ZipFile(zip_path, "a") as zf:
+                zf.writestr(PLUGIN_MANIFEST_FILE, json.dumps(manifest_data))
+            return zip_path
 
-    def test_install_from_zip(self, loader, plugins_dir, tmp_path):
+        return _make
+
+    def test_install_from_zip(self, loader, plugins_dir, make_plugin_zip):
         """Test installing a plugin from ZIP."""
-        zip_path = self.create_plugin_zip(tmp_path, "zip-plugin", {
+        zip_path = make_plugin_zip("zip-plugin", {
             "id": "zip-plugin",
             "name": "ZIP Plugin",
             "version": "1.0.0",
@@ -489,10 +661,12 @@ class TestPlugin(BasePlugin):
         with pytest.raises(PluginValidationError, match=r"No .* found"):
             loader.install_from_zip(zip_path)
 
-    def test_install_from_zip_already_installed(self, loader, plugins_dir, tmp_path):
+    def test_install_from_zip_already_installed(
+        self, loader, plugins_dir, make_plugin_zip
+    ):
         """Test installing plugin that already exists without upgrade flag."""
         # First install
-        zip_path = self.create_plugin_zip(tmp_path, "dup-plugin", {
+        zip_path = make_plugin_zip("dup-plugin", {
             "id": "dup-plugin",
             "name": "Dup Plugin",
             "version": "1.0.0",
@@ -504,10 +678,10 @@ class TestPlugin(BasePlugin):
         with pytest.raises(PluginValidationError, match="already installed"):
             loader.install_from_zip(zip_path)
 
-    def test_install_from_zip_upgrade(self, loader, plugins_dir, tmp_path):
+    def test_install_from_zip_upgrade(self, loader, plugins_dir, make_plugin_zip):
         """Test upgrading an existing plugin with upgrade flag."""
         # First install v1.0.0
-        zip_path_v1 = self.create_plugin_zip(tmp_path, "upgrade-plugin-v1", {
+        zip_path_v1 = make_plugin_zip("upgrade-plugin-v1", {
             "id": "upgrade-plugin",
             "name": "Upgrade Plugin",
             "version": "1.0.0",
@@ -518,7 +692,7 @@ class TestPlugin(BasePlugin):
         assert old_version is None
 
         # Now upgrade to v2.0.0
-        zip_path_v2 = self.create_plugin_zip(tmp_path, "upgrade-plugin-v2", {
+        zip_path_v2 = make_plugin_zip("upgrade-plugin-v2", {
             "id": "upgrade-plugin",
             "name": "Upgrade Plugin",
             "version": "2.0.0",
@@ -539,10 +713,10 @@ class TestPlugin(BasePlugin):
         assert disk_manifest["version"] == "2.0.0"
 
     def test_install_from_zip_with_dangerous_permissions(
-        self, loader, plugins_dir, tmp_path
+        self, loader, plugins_dir, make_plugin_zip
     ):
         """Test that plugins with dangerous permissions can still be installed."""
-        zip_path = self.create_plugin_zip(tmp_path, "dangerous-plugin", {
+        zip_path = make_plugin_zip("dangerous-plugin", {
             "id": "dangerous-plugin",
             "name": "Dangerous Plugin",
             "version": "1.0.0",
@@ -560,21 +734,113 @@ class TestPlugin(BasePlugin):
         assert Permission.USER_WRITE_ALL in manifest.permissions
         assert Permission.SYSTEM_SETTINGS_WRITE in manifest.permissions
 
+    def test_install_from_zip_upgrade_without_old_manifest(
+        self, loader, plugins_dir, make_plugin_zip
+    ):
+        """Test upgrading over a plugin directory that lost its manifest."""
+        (plugins_dir / "bare-plugin").mkdir()
+        (plugins_dir / "bare-plugin" / "stale.txt").write_text("old")
+        zip_path = make_plugin_zip("bare-plugin", {
+            "id": "bare-plugin",
+            "name": "Bare Plugin",
+            "version": "1.0.0",
+            "description": "Replaces a broken install",
+        })
 
-class TestLoadPluginClass:
-    """Tests for loading plugin classes."""
+        manifest, old_version = loader.install_from_zip(zip_path, upgrade=True)
 
-    @pytest.fixture
-    def plugins_dir(self, tmp_path):
-        """Create a temporary plugins directory."""
-        plugins = tmp_path / "plugins"
-        plugins.mkdir()
-        return plugins
+        assert manifest.id == "bare-plugin"
+        assert old_version is None
+        assert (plugins_dir / "bare-plugin" / PLUGIN_MANIFEST_FILE).exists()
+        assert not (plugins_dir / "bare-plugin" / "stale.txt").exists()
 
-    @pytest.fixture
-    def loader(self, plugins_dir):
-        """Create a PluginLoader instance."""
-        return PluginLoader(plugins_dir)
+    def test_install_from_zip_failed_extraction_keeps_existing(
+        self, loader, plugins_dir, make_plugin_zip, monkeypatch
+    ):
+        """Test that a failed upgrade leaves the installed plugin untouched."""
+        manifest_data = {
+            "id": "safe-plugin",
+            "name": "Safe Plugin",
+            "version": "1.0.0",
+            "description": "Version 1",
+        }
+        loader.install_from_zip(
+            make_plugin_zip("safe-v1", manifest_data)
+        )
+        zip_path_v2 = make_plugin_zip(
+            "safe-v2", {**manifest_data, "version": "2.0.0"}
+        )
+
+        def failing_extract(zf, infos, prefix, target_dir):
+            target_dir.mkdir()
+            raise OSError("disk full")
+
+        monkeypatch.setattr("src.plugins.loader._extract_members", failing_extract)
+        with pytest.raises(OSError, match="disk full"):
+            loader.install_from_zip(zip_path_v2, upgrade=True)
+
+        installed = parse_manifest(plugins_dir / "safe-plugin" / PLUGIN_MANIFEST_FILE)
+        assert installed.version == "1.0.0"
+        assert [p.name for p in plugins_dir.iterdir()] == ["safe-plugin"]
+
+    def test_install_from_zip_failed_swap_keeps_existing(
+        self, loader, plugins_dir, make_plugin_zip, monkeypatch
+    ):
+        """Test that an upgrade failing to rename into place restores the old."""
+        manifest_data = {
+            "id": "swap-plugin",
+            "name": "Swap Plugin",
+            "version": "1.0.0",
+            "description": "Version 1",
+        }
+        loader.install_from_zip(make_plugin_zip("swap-v1", manifest_data))
+        zip_path_v2 = make_plugin_zip("swap-v2", {**manifest_data, "version": "2.0.0"})
+
+        rename = Path.rename
+
+        def failing_rename(self, target):
+            if self.name.endswith(".installing"):
+                raise OSError("cross-device link")
+            return rename(self, target)
+
+        monkeypatch.setattr(Path, "rename", failing_rename)
+        with pytest.raises(OSError, match="cross-device link"):
+            loader.install_from_zip(zip_path_v2, upgrade=True)
+
+        installed = parse_manifest(plugins_dir / "swap-plugin" / PLUGIN_MANIFEST_FILE)
+        assert installed.version == "1.0.0"
+        assert [p.name for p in plugins_dir.iterdir()] == ["swap-plugin"]
+
+    def test_install_from_zip_restores_interrupted_upgrade(
+        self, loader, plugins_dir, make_plugin_zip
+    ):
+        """Test that a plugin left aside by an interrupted upgrade is restored."""
+        manifest_data = {
+            "id": "interrupted-plugin",
+            "name": "Interrupted Plugin",
+            "version": "1.0.0",
+            "description": "Version 1",
+        }
+        loader.install_from_zip(make_plugin_zip("interrupted-v1", manifest_data))
+        (plugins_dir / "interrupted-plugin").rename(
+            plugins_dir / ".interrupted-plugin.old"
+        )
+
+        zip_path_v2 = make_plugin_zip(
+            "interrupted-v2", {**manifest_data, "version": "2.0.0"}
+        )
+        with pytest.raises(PluginValidationError, match="already installed"):
+            loader.install_from_zip(zip_path_v2)
+
+        installed = parse_manifest(
+            plugins_dir / "interrupted-plugin" / PLUGIN_MANIFEST_FILE
+        )
+        assert installed.version == "1.0.0"
+        assert [p.name for p in plugins_dir.iterdir()] == ["interrupted-plugin"]
+
+
+class TestLoadPluginClass:
+    """Tests for loading plugin classes."""
 
     def test_load_plugin_no_module(self, loader, plugins_dir):
         """Test loading plugin without plugin.py raises error."""
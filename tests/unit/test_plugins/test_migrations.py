@@ -88,3 +88,11 @@ class TestGetTablePrefix:
 
         # "data_export" -> "de_" (underscores converted to hyphens, then initials)
         assert runner._get_table_prefix() == "de_"
+
+    def test_table_prefix_computed_once(self, plugin_path: Path):
+        """Test that the derived prefix is cached on the runner."""
+        runner = PluginMigrationRunner(plugin_path, "my-cool-plugin")
+
+        assert runner.table_prefix == "mcp_"
+        runner.plugin_id = "other"
+        assert runner._get_table_prefix() == "mcp_"
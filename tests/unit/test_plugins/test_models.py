@@ -3,6 +3,8 @@
 """Tests for plugin database models."""
 
 import pytest
+from sqlalchemy import exists, insert, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from src.models.plugin_config import PluginConfigModel, PluginMigrationHistory
 
@@ -45,6 +47,25 @@ class TestPluginConfigModel:
         with pytest.raises(IntegrityError):
             db_session.commit()
 
+    def test_plugin_id_unique_ignores_duplicate_insert(self, db_session):
+        """Test that the unique plugin_id drops a conflicting insert."""
+        db_session.execute(
+            sqlite_insert(PluginConfigModel).on_conflict_do_nothing(
+                index_elements=["plugin_id"]
+            ),
+            [
+                {"plugin_id": "ignored-duplicate", "plugin_version": version}
+                for version in ("1.0.0", "2.0.0")
+            ],
+        )
+
+        versions = db_session.scalars(
+            select(PluginConfigModel.plugin_version).where(
+                PluginConfigModel.plugin_id == "ignored-duplicate"
+            )
+        ).all()
+        assert versions == ["1.0.0"]
+
     def test_set_and_get_encrypted_settings(self, db_session):
         """Test encrypting and decrypting settings."""
         config = PluginConfigModel(
@@ -75,14 +96,9 @@ class TestPluginConfigModel:
         assert decrypted["timeout"] == 30
         assert decrypted["nested"]["value"] == "test"
 
-    def test_get_decrypted_settings_empty(self, db_session):
+    def test_get_decrypted_settings_empty(self, make_config):
         """Test getting settings when none are set."""
-        config = PluginConfigModel(
-            plugin_id="empty-settings",
-            plugin_version="1.0.0",
-        )
-        db_session.add(config)
-        db_session.commit()
+        config = make_config("empty-settings")
 
         settings = config.get_decrypted_settings()
         assert settings == {}
@@ -101,15 +117,9 @@ class TestPluginConfigModel:
         settings = config.get_decrypted_settings()
         assert settings == {}
 
-    def test_update_settings(self, db_session):
+    def test_update_settings(self, db_session, make_config):
         """Test updating settings."""
-        config = PluginConfigModel(
-            plugin_id="update-settings",
-            plugin_version="1.0.0",
-        )
-        config.set_encrypted_settings({"key1": "value1"})
-        db_session.add(config)
-        db_session.commit()
+        config = make_config("update-settings", settings={"key1": "value1"})
 
         # Update settings
         config.set_encrypted_settings({"key2": "value2"})
@@ -154,8 +164,8 @@ class TestPluginConfigModel:
         config = PluginConfigModel(
             plugin_id="with-permissions",
             plugin_version="1.0.0",
-            permissions_granted="user.read,event.write",
         )
+        config.set_granted_permissions(["user.read", "event.write"])
         db_session.add(config)
         db_session.commit()
 
@@ -164,8 +174,14 @@ class TestPluginConfigModel:
             .filter(PluginConfigModel.plugin_id == "with-permissions")
             .first()
         )
-        assert "user.read" in retrieved.permissions_granted
-        assert "event.write" in retrieved.permissions_granted
+        assert retrieved.get_granted_permissions() == ["user.read", "event.write"]
+
+    def test_get_granted_permissions_empty(self, make_config):
+        """Test getting permissions when none are granted."""
+        config = make_config("no-permissions")
+
+        assert config.permissions_granted is None
+        assert config.get_granted_permissions() == []
 
 
 class TestPluginMigrationHistory:
@@ -188,14 +204,17 @@ class TestPluginMigrationHistory:
 
     def test_multiple_migrations_same_plugin(self, db_session):
         """Test recording multiple migrations for same plugin."""
-        for i, revision in enumerate(["rev1", "rev2", "rev3"]):
-            history = PluginMigrationHistory(
-                plugin_id="multi-migration",
-                revision=revision,
-                applied_at=f"2025-01-{15 + i}T10:30:00",
-            )
-            db_session.add(history)
-
+        db_session.execute(
+            insert(PluginMigrationHistory),
+            [
+                {
+                    "plugin_id": "multi-migration",
+                    "revision": revision,
+                    "applied_at": f"2025-01-{15 + i}T10:30:00",
+                }
+                for i, revision in enumerate(["rev1", "rev2", "rev3"])
+            ],
+        )
         db_session.commit()
 
         histories = (
@@ -208,14 +227,17 @@ class TestPluginMigrationHistory:
     def test_delete_migration_history_for_plugin(self, db_session):
         """Test deleting all migration history for a plugin."""
         # Create histories for two plugins
-        for plugin_id in ["plugin-a", "plugin-b"]:
-            history = PluginMigrationHistory(
-                plugin_id=plugin_id,
-                revision="rev1",
-                applied_at="2025-01-15T10:30:00",
-            )
-            db_session.add(history)
-
+        db_session.execute(
+            insert(PluginMigrationHistory),
+            [
+                {
+                    "plugin_id": plugin_id,
+                    "revision": "rev1",
+                    "applied_at": "2025-01-15T10:30:00",
+                }
+                for plugin_id in ["plugin-a", "plugin-b"]
+            ],
+        )
         db_session.commit()
 
         # Delete plugin-a's history
@@ -224,18 +246,13 @@ class TestPluginMigrationHistory:
         ).delete()
         db_session.commit()
 
+        def has_history(plugin_id):
+            return db_session.query(
+                exists().where(PluginMigrationHistory.plugin_id == plugin_id)
+            ).scalar()
+
         # plugin-a should have no history
-        plugin_a_count = (
-            db_session.query(PluginMigrationHistory)
-            .filter(PluginMigrationHistory.plugin_id == "plugin-a")
-            .count()
-        )
-        assert plugin_a_count == 0
+        assert not has_history("plugin-a")
 
         # plugin-b should still have history
-        plugin_b_count = (
-            db_session.query(PluginMigrationHistory)
-            .filter(PluginMigrationHistory.plugin_id == "plugin-b")
-            .count()
-        )
-        assert plugin_b_count == 1
+        assert has_history("plugin-b")
@@ -36,49 +36,46 @@ class TestPermissionConstants:
 class TestPermissionChecker:
     """Tests for PermissionChecker class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def checker(self):
-        """Create a PermissionChecker instance."""
+        """Create a PermissionChecker shared by the class (it is stateless)."""
         return PermissionChecker()
 
-    def test_parse_valid_permissions(self, checker):
-        """Test parsing valid permission strings."""
-        valid, invalid = checker.parse_permissions([
-            "user.read",
-            "event.write",
-            "company.read",
-        ])
-        assert Permission.USER_READ in valid
-        assert Permission.EVENT_WRITE in valid
-        assert Permission.COMPANY_READ in valid
-        assert len(invalid) == 0
-
-    def test_parse_invalid_permissions(self, checker):
-        """Test parsing invalid permission strings."""
-        valid, invalid = checker.parse_permissions([
-            "user.read",
-            "invalid.permission",
-            "another.invalid",
-        ])
-        assert Permission.USER_READ in valid
-        assert len(valid) == 1
-        assert "invalid.permission" in invalid
-        assert "another.invalid" in invalid
-
-    def test_parse_empty_list(self, checker):
-        """Test parsing empty permission list."""
-        valid, invalid = checker.parse_permissions([])
-        assert len(valid) == 0
-        assert len(invalid) == 0
-
-    def test_parse_all_invalid(self, checker):
-        """Test parsing list with all invalid permissions."""
-        valid, invalid = checker.parse_permissions([
-            "not.a.permission",
-            "fake.perm",
-        ])
-        assert len(valid) == 0
-        assert len(invalid) == 2
+    @pytest.mark.parametrize(
+        ("permissions", "expected_valid", "expected_invalid"),
+        [
+            (
+                ["user.read", "event.write", "company.read"],
+                {Permission.USER_READ, Permission.EVENT_WRITE, Permission.COMPANY_READ},
+                [],
+            ),
+            (
+                ["user.read", "invalid.permission", "another.invalid"],
+                {Permission.USER_READ},
+                ["invalid.permission", "another.invalid"],
+            ),
+            ([], set(), []),
+            (
+                ["not.a.permission", "fake.perm"],
+                set(),
+                ["not.a.permission", "fake.perm"],
+            ),
+        ],
+        ids=["valid", "mixed", "empty", "all-invalid"],
+    )
+    def test_parse_permissions(
+        self, checker, permissions, expected_valid, expected_invalid
+    ):
+        """Test splitting permission strings into valid and invalid ones."""
+        valid, invalid = checker.parse_permissions(permissions)
+        assert valid == expected_valid
+        assert invalid == expected_invalid
+
+    def test_parse_non_string_entries_invalid(self, checker):
+        """Test that non-string entries are reported invalid, not raised."""
+        valid, invalid = checker.parse_permissions(["user.read", {"code": "x"}, 1])
+        assert valid == {Permission.USER_READ}
+        assert invalid == [{"code": "x"}, 1]
 
     def test_get_dangerous_permissions(self, checker):
         """Test identifying dangerous permissions."""
@@ -150,16 +147,9 @@ class TestPermissionChecker:
 
         formatted = checker.format_permissions_for_display(permissions)
 
-        assert len(formatted) == 2
+        # Entries come back sorted by value
+        assert [p["value"] for p in formatted] == ["user.read", "user.write.all"]
+        by_value = {p["value"]: p for p in formatted}
         # Check that dangerous permissions are flagged
-        dangerous_entry = next(
-            (p for p in formatted if p["value"] == "user.write.all"), None
-        )
-        assert dangerous_entry is not None
-        assert dangerous_entry["dangerous"] is True
-
-        safe_entry = next(
-            (p for p in formatted if p["value"] == "user.read"), None
-        )
-        assert safe_entry is not None
-        assert safe_entry["dangerous"] is False
+        assert by_value["user.write.all"]["dangerous"] is True
+        assert by_value["user.read"]["dangerous"] is False
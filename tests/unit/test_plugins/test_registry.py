@@ -2,15 +2,30 @@
 # SPDX-License-Identifier: GPL-2.0-only
 """Tests for plugin registry."""
 
-import json
 from pathlib import Path
 
+import orjson
 import pytest
 
 from src.plugins.base import BasePlugin, PluginConfig, PluginManifest
-from src.plugins.loader import PLUGIN_MANIFEST_FILE
+from src.plugins.loader import PLUGIN_MANIFEST_FILE, PluginLoader
 from src.plugins.registry import PluginRegistry
 
+PLUGIN_PY_BYTES = b"""
+from src.plugins.base import BasePlugin
+
+class TestPlugin(BasePlugin):
+    @classmethod
+    def get_config_schema(cls):
+        return {}
+
+    def get_router(self):
+        return None
+
+    def get_models(self):
+        return []
+"""
+
 
 class ConcretePlugin(BasePlugin):
     """Concrete plugin implementation for testing."""
@@ -124,69 +139,39 @@ class TestPluginRegistryWithDatabase:
         yield
         PluginRegistry.reset_instance()
 
-    @pytest.fixture
-    def plugins_dir(self, tmp_path):
-        """Create a temporary plugins directory."""
-        plugins = tmp_path / "plugins"
-        plugins.mkdir()
-        return plugins
+    @pytest.fixture(autouse=True)
+    def _patch_loader(self, plugins_dir, monkeypatch):
+        """Make every PluginLoader the registry creates use plugins_dir."""
+        original_init = PluginLoader.__init__
+
+        def patched_init(loader, plugins_dir_arg=None):
+            original_init(loader, plugins_dir)
+
+        monkeypatch.setattr(PluginLoader, "__init__", patched_init)
 
     def create_plugin_structure(
         self, plugins_dir: Path, plugin_id: str, manifest_data: dict
     ) -> Path:
         """Helper to create a plugin directory structure."""
         plugin_dir = plugins_dir / plugin_id
-        plugin_dir.mkdir(parents=True)
-
-        manifest_path = plugin_dir / PLUGIN_MANIFEST_FILE
-        manifest_path.write_text(json.dumps(manifest_data))
-
-        backend_dir = plugin_dir / "backend"
-        backend_dir.mkdir()
-
-        plugin_py = backend_dir / "plugin.py"
-        plugin_py.write_text("""
-from src.plugins.base import BasePlugin
-
-class TestPlugin(BasePlugin):
-    @classmethod
-    def get_config_schema(cls):
-        return {}
-
-    def get_router(self):
-        return None
-
-    def get_models(self):
-        return []
-""")
+        # Creates the plugin directory on the way to backend/
+        (plugin_dir / "backend").mkdir(parents=True)
+        (plugin_dir / PLUGIN_MANIFEST_FILE).write_bytes(orjson.dumps(manifest_data))
+        (plugin_dir / "backend" / "plugin.py").write_bytes(PLUGIN_PY_BYTES)
 
         return plugin_dir
 
     @pytest.mark.asyncio
-    async def test_load_all_plugins_empty(self, db_session, plugins_dir, monkeypatch):
+    async def test_load_all_plugins_empty(self, db_session):
         """Test loading plugins when none exist."""
-        from src.plugins.loader import PluginLoader
-
-        # Monkeypatch the loader to use our temp directory
-        original_init = PluginLoader.__init__
-
-        def patched_init(self, plugins_dir_arg=None):
-            original_init(self, plugins_dir)
-
-        monkeypatch.setattr(PluginLoader, "__init__", patched_init)
-
         registry = PluginRegistry.get_instance()
         await registry.load_all_plugins(db_session)
 
         assert registry.get_all_plugins() == []
 
     @pytest.mark.asyncio
-    async def test_load_all_plugins_skips_unregistered(
-        self, db_session, plugins_dir, monkeypatch
-    ):
+    async def test_load_all_plugins_skips_unregistered(self, db_session, plugins_dir):
         """Test that unregistered plugins are skipped."""
-        from src.plugins.loader import PluginLoader
-
         # Create plugin on disk but not in database
         self.create_plugin_structure(
             plugins_dir,
@@ -199,13 +184,6 @@ class TestPlugin(BasePlugin):
             },
         )
 
-        original_init = PluginLoader.__init__
-
-        def patched_init(self, plugins_dir_arg=None):
-            original_init(self, plugins_dir)
-
-        monkeypatch.setattr(PluginLoader, "__init__", patched_init)
-
         registry = PluginRegistry.get_instance()
         await registry.load_all_plugins(db_session)
 
@@ -214,12 +192,9 @@ class TestPlugin(BasePlugin):
 
     @pytest.mark.asyncio
     async def test_load_all_plugins_skips_disabled(
-        self, db_session, plugins_dir, monkeypatch
+        self, db_session, plugins_dir, make_config
     ):
         """Test that disabled plugins are skipped."""
-        from src.models.plugin_config import PluginConfigModel
-        from src.plugins.loader import PluginLoader
-
         # Create plugin on disk
         self.create_plugin_structure(
             plugins_dir,
@@ -233,25 +208,40 @@ class TestPlugin(BasePlugin):
         )
 
         # Register as disabled in database
-        db_config = PluginConfigModel(
-            plugin_id="disabled-plugin",
-            plugin_version="1.0.0",
-        )
-        db_session.add(db_config)
-        db_session.commit()
+        make_config("disabled-plugin")
 
-        original_init = PluginLoader.__init__
+        registry = PluginRegistry.get_instance()
+        await registry.load_all_plugins(db_session)
 
-        def patched_init(self, plugins_dir_arg=None):
-            original_init(self, plugins_dir)
+        # Disabled plugin should not be loaded
+        assert registry.get_plugin("disabled-plugin") is None
 
-        monkeypatch.setattr(PluginLoader, "__init__", patched_init)
+    @pytest.mark.asyncio
+    async def test_load_all_plugins_syncs_version(
+        self, db_session, plugins_dir, make_config
+    ):
+        """Test that the stored version follows the manifest on disk."""
+        for plugin_id, version in (("synced", "2.0.0"), ("unchanged", "1.0.0")):
+            self.create_plugin_structure(
+                plugins_dir,
+                plugin_id,
+                {
+                    "id": plugin_id,
+                    "name": plugin_id.title(),
+                    "version": version,
+                    "description": "Registered plugin",
+                },
+            )
+        synced = make_config("synced")
+        unchanged = make_config("unchanged")
 
         registry = PluginRegistry.get_instance()
         await registry.load_all_plugins(db_session)
 
-        # Disabled plugin should not be loaded
-        assert registry.get_plugin("disabled-plugin") is None
+        db_session.refresh(synced)
+        db_session.refresh(unchanged)
+        assert synced.plugin_version == "2.0.0"
+        assert unchanged.plugin_version == "1.0.0"
 
     @pytest.mark.asyncio
     async def test_update_plugin_settings_not_found(self, db_session):
@@ -264,17 +254,10 @@ class TestPlugin(BasePlugin):
             )
 
     @pytest.mark.asyncio
-    async def test_update_plugin_settings(self, db_session):
+    async def test_update_plugin_settings(self, db_session, make_config):
         """Test updating plugin settings."""
-        from src.models.plugin_config import PluginConfigModel
-
         # Create plugin config in database
-        db_config = PluginConfigModel(
-            plugin_id="test-plugin",
-            plugin_version="1.0.0",
-        )
-        db_session.add(db_config)
-        db_session.commit()
+        make_config("test-plugin")
 
         registry = PluginRegistry.get_instance()
 
@@ -299,10 +282,9 @@ class TestPlugin(BasePlugin):
         assert plugin.config.settings["new_key"] == "new_value"
 
     @pytest.mark.asyncio
-    async def test_uninstall_plugin(self, db_session, plugins_dir, monkeypatch):
+    async def test_uninstall_plugin(self, db_session, plugins_dir, make_config):
         """Test uninstalling a plugin."""
         from src.models.plugin_config import PluginConfigModel
-        from src.plugins.loader import PluginLoader
 
         # Create plugin on disk
         self.create_plugin_structure(
@@ -317,19 +299,7 @@ class TestPlugin(BasePlugin):
         )
 
         # Create plugin config in database
-        db_config = PluginConfigModel(
-            plugin_id="to-uninstall",
-            plugin_version="1.0.0",
-        )
-        db_session.add(db_config)
-        db_session.commit()
-
-        original_init = PluginLoader.__init__
-
-        def patched_init(self, plugins_dir_arg=None):
-            original_init(self, plugins_dir)
-
-        monkeypatch.setattr(PluginLoader, "__init__", patched_init)
+        make_config("to-uninstall")
 
         registry = PluginRegistry.get_instance()
 
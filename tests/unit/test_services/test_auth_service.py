@@ -2,8 +2,12 @@
 # SPDX-License-Identifier: GPL-2.0-only
 """Tests for auth_service."""
 
+import uuid
 from datetime import datetime, timedelta
 
+import pytest
+from sqlalchemy import insert
+
 from src.models import SystemSettings, User
 from src.models.session import Session as SessionModel
 from src.schemas.auth import RegisterRequest
@@ -12,13 +16,34 @@ from src.services import auth_service
 from src.services import email_template_service as email_service
 from src.services.rbac_seed_service import seed_rbac_data
 
+# bcrypt is deliberately slow; hash the shared test password only once
+SECRET_HASH = get_password_hash("Secret123!")
+
+# Fixed clock for the session expiry tests
+NOW = datetime(2025, 1, 1, 12, 0, 0)
+
+
+class FrozenDatetime(datetime):
+    """datetime whose utcnow() always returns NOW."""
+
+    @classmethod
+    def utcnow(cls):
+        return NOW
+
+
+@pytest.fixture
+def frozen_now(monkeypatch) -> datetime:
+    """Freeze auth_service's clock at NOW."""
+    monkeypatch.setattr(auth_service, "datetime", FrozenDatetime)
+    return NOW
+
 
 def create_user(db_session, username: str = "existing") -> User:
     """Helper to create a persisted user."""
     user = User(
         username=username,
         email=f"{username}@example.com",
-        hashed_password=get_password_hash("Secret123!"),
+        hashed_password=SECRET_HASH,
         is_admin=False,
         is_active=True,
     )
@@ -109,15 +134,18 @@ def test_authenticate_success_and_failures(db_session):
     assert auth_service.authenticate(db_session, "authuser", "Secret123!") is None
 
 
-def test_session_lifecycle(db_session):
+def test_session_lifecycle(db_session, frozen_now):
     user = create_user(db_session, "sessionuser")
     token = auth_service.create_session(db_session, user.id)
     session = auth_service.get_session(db_session, token)
     assert session is not None
     assert session.user_id == user.id
+    assert session.expires_at == frozen_now + timedelta(
+        days=auth_service.SESSION_EXPIRY_DAYS
+    )
 
     # Force expiry and ensure it gets deleted
-    session.expires_at = datetime.utcnow() - timedelta(days=1)
+    session.expires_at = frozen_now - timedelta(days=1)
     db_session.commit()
     assert auth_service.get_session(db_session, token) is None
     assert auth_service.delete_session(db_session, token) is False
@@ -137,12 +165,19 @@ def test_get_user_helpers(db_session):
     assert auth_service.get_user_by_email(db_session, "lookup@example.com") == user
 
 
-def test_cleanup_expired_sessions(db_session):
+def test_cleanup_expired_sessions(db_session, frozen_now):
     user = create_user(db_session, "cleaner")
-    for idx in range(3):
-        token = auth_service.create_session(db_session, user.id)
-        session = db_session.query(SessionModel).filter_by(token=token).first()
-        session.expires_at = datetime.utcnow() - timedelta(days=idx + 1)
+    db_session.execute(
+        insert(SessionModel),
+        [
+            {
+                "user_id": user.id,
+                "token": str(uuid.uuid4()),
+                "expires_at": frozen_now - timedelta(days=idx + 1),
+            }
+            for idx in range(3)
+        ],
+    )
     db_session.commit()
 
     deleted = auth_service.cleanup_expired_sessions(db_session)
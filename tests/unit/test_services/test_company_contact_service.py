@@ -2,17 +2,21 @@
 # SPDX-License-Identifier: GPL-2.0-only
 """Tests for company_contact_service."""
 
+import pytest
+
 from src.models import Company
 from src.models.enums import CompanyType, ContactType
 from src.schemas.company_contact import CompanyContactCreate, CompanyContactUpdate
 from src.services import company_contact_service
 
 
-def create_company(db_session) -> Company:
+@pytest.fixture
+def company(db_session) -> Company:
+    """Company the contacts under test belong to."""
     company = Company(name="Acme", type=CompanyType.EMPLOYER)
     db_session.add(company)
-    db_session.commit()
-    db_session.refresh(company)
+    # The row only has to exist inside the test's transaction, so flush suffices
+    db_session.flush()
     return company
 
 
@@ -28,15 +32,13 @@ def create_contact(
     return company_contact_service.create_contact(db_session, company_id, data)
 
 
-def test_create_contact_sets_main_for_first_contact(db_session):
-    company = create_company(db_session)
+def test_create_contact_sets_main_for_first_contact(db_session, company):
     contact = create_contact(db_session, company.id, "first", is_main=False)
 
     assert contact.is_main_contact is True
 
 
-def test_create_contact_unsets_existing_main(db_session):
-    company = create_company(db_session)
+def test_create_contact_unsets_existing_main(db_session, company):
     first = create_contact(db_session, company.id, "first", is_main=True)
     second = create_contact(
         db_session, company.id, "second", contact_types=[ContactType.HR], is_main=True
@@ -47,8 +49,7 @@ def test_create_contact_unsets_existing_main(db_session):
     assert second.is_main_contact is True
 
 
-def test_update_contact_fields(db_session):
-    company = create_company(db_session)
+def test_update_contact_fields(db_session, company):
     contact = create_contact(db_session, company.id, "first", is_main=True)
     other = create_contact(db_session, company.id, "other", is_main=False)
 
@@ -67,16 +68,14 @@ def test_update_contact_fields(db_session):
     assert other.is_main_contact is True
 
 
-def test_set_main_contact(db_session):
-    company = create_company(db_session)
+def test_set_main_contact(db_session, company):
     contact = create_contact(db_session, company.id, "first", is_main=False)
 
     updated = company_contact_service.set_main_contact(db_session, contact)
     assert updated.is_main_contact is True
 
 
-def test_delete_contact_reassigns_main(db_session):
-    company = create_company(db_session)
+def test_delete_contact_reassigns_main(db_session, company):
     first = create_contact(db_session, company.id, "first", is_main=True)
     second = create_contact(db_session, company.id, "second", is_main=False)
 
@@ -85,8 +84,7 @@ def test_delete_contact_reassigns_main(db_session):
     assert second.is_main_contact is True
 
 
-def test_getters_and_filters(db_session):
-    company = create_company(db_session)
+def test_getters_and_filters(db_session, company):
     contact = create_contact(
         db_session,
         company.id,
@@ -113,8 +111,7 @@ def test_getters_and_filters(db_session):
     assert filtered == [contact]
 
 
-def test_validate_contact_types_exist(db_session):
-    company = create_company(db_session)
+def test_validate_contact_types_exist(db_session, company):
     create_contact(
         db_session,
         company.id,
@@ -136,8 +133,7 @@ def test_validate_contact_types_exist(db_session):
     assert missing == [ContactType.SALES]
 
 
-def test_contact_to_response(db_session):
-    company = create_company(db_session)
+def test_contact_to_response(db_session, company):
     contact = create_contact(db_session, company.id, "first", is_main=True)
     response = company_contact_service.contact_to_response(contact)
     assert response.name == "first"
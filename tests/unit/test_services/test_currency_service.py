@@ -15,13 +15,21 @@ from src.services.currency_service import (
     Currency,
     CurrencyService,
     CurrencyServiceError,
+    clear_supported_currencies_cache,
 )
 
 
 @pytest.fixture
-def currency_service(db_session):
-    """Create a currency service with test database."""
-    return CurrencyService(db_session)
+async def currency_service(db_session):
+    """Create a currency service with test database.
+
+    The process-wide supported currencies cache is cleared first, and the
+    service's pooled HTTP client is closed once the test is done.
+    """
+    clear_supported_currencies_cache()
+    service = CurrencyService(db_session)
+    yield service
+    await service.close()
 
 
 class TestGetSupportedCurrencies:
@@ -61,6 +69,21 @@ class TestGetSupportedCurrencies:
 
         assert route.call_count == 1
 
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_shares_cache_between_instances(self, currency_service, db_session):
+        """Should reuse currencies fetched by another service instance."""
+        route = respx.get("https://api.frankfurter.app/currencies").mock(
+            return_value=Response(200, json={"EUR": "Euro"})
+        )
+        await currency_service.get_supported_currencies()
+
+        other_service = CurrencyService(db_session)
+        currencies = await other_service.get_supported_currencies()
+
+        assert currencies == [Currency(code="EUR", name="Euro")]
+        assert route.call_count == 1
+
     @respx.mock
     @pytest.mark.asyncio
     async def test_raises_on_api_error(self, currency_service):
@@ -217,6 +240,170 @@ class TestGetRate:
         assert rate_date == date(2025, 1, 14)
 
 
+class TestHttpClient:
+    """Tests for the service's pooled HTTP client."""
+
+    @pytest.mark.asyncio
+    async def test_reuses_client_until_closed(self, currency_service):
+        """Should hand out one client per service and recreate it after close."""
+        client = await currency_service._get_client()
+        assert await currency_service._get_client() is client
+
+        await currency_service.close()
+        assert client.is_closed
+        assert await currency_service._get_client() is not client
+
+
+class TestGetRatesBulk:
+    """Tests for get_rates_bulk method."""
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_resolves_cached_fetched_and_same_currency(
+        self, currency_service, db_session
+    ):
+        """Should use the cache and fetch each missing request only once."""
+        db_session.add(
+            CurrencyCache(
+                base_currency="PLN",
+                target_currency="EUR",
+                rate=Decimal("0.231"),
+                rate_date=date(2025, 1, 15),
+                fetched_at=datetime.utcnow(),
+            )
+        )
+        db_session.commit()
+        route = respx.get("https://api.frankfurter.app/2025-02-20").mock(
+            return_value=Response(
+                200,
+                json={
+                    "amount": 1.0,
+                    "base": "PLN",
+                    "date": "2025-02-20",
+                    "rates": {"EUR": 0.24},
+                },
+            )
+        )
+
+        rates = await currency_service.get_rates_bulk(
+            [
+                ("PLN", "EUR", date(2025, 1, 15)),
+                ("pln", "eur", date(2025, 1, 16)),
+                ("PLN", "EUR", date(2025, 2, 20)),
+                ("pln", "EUR", date(2025, 2, 20)),
+                ("EUR", "eur", date(2025, 2, 20)),
+            ]
+        )
+
+        assert rates == {
+            ("PLN", "EUR", date(2025, 1, 15)): (Decimal("0.231"), date(2025, 1, 15)),
+            ("pln", "eur", date(2025, 1, 16)): (Decimal("0.231"), date(2025, 1, 15)),
+            ("PLN", "EUR", date(2025, 2, 20)): (Decimal("0.24"), date(2025, 2, 20)),
+            ("pln", "EUR", date(2025, 2, 20)): (Decimal("0.24"), date(2025, 2, 20)),
+            ("EUR", "eur", date(2025, 2, 20)): (Decimal("1.0"), date(2025, 2, 20)),
+        }
+        assert route.call_count == 1
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_caches_shared_rate_date_once(self, currency_service, db_session):
+        """Should store one cache row when several dates share a rate."""
+        for day in ("2025-01-18", "2025-01-19"):
+            respx.get(f"https://api.frankfurter.app/{day}").mock(
+                return_value=Response(
+                    200,
+                    json={
+                        "amount": 1.0,
+                        "base": "GBP",
+                        "date": "2025-01-17",
+                        "rates": {"EUR": 1.19},
+                    },
+                )
+            )
+
+        rates = await currency_service.get_rates_bulk(
+            [
+                ("GBP", "EUR", date(2025, 1, 18)),
+                ("GBP", "EUR", date(2025, 1, 19)),
+            ]
+        )
+
+        assert set(rates.values()) == {(Decimal("1.19"), date(2025, 1, 17))}
+        cached = (
+            db_session.query(CurrencyCache)
+            .filter(CurrencyCache.base_currency == "GBP")
+            .all()
+        )
+        assert [row.rate_date for row in cached] == [date(2025, 1, 17)]
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_refreshes_stale_cached_rate(self, currency_service, db_session):
+        """Should overwrite a stale cache row instead of adding another."""
+        stale = CurrencyCache(
+            base_currency="GBP",
+            target_currency="EUR",
+            rate=Decimal("1.10"),
+            rate_date=date(2025, 1, 17),
+            fetched_at=datetime.utcnow() - timedelta(days=2),
+        )
+        db_session.add(stale)
+        db_session.commit()
+        respx.get("https://api.frankfurter.app/2025-01-17").mock(
+            return_value=Response(
+                200,
+                json={
+                    "amount": 1.0,
+                    "base": "GBP",
+                    "date": "2025-01-17",
+                    "rates": {"EUR": 1.19},
+                },
+            )
+        )
+
+        await currency_service.get_rates_bulk([("GBP", "EUR", date(2025, 1, 17))])
+
+        cached = (
+            db_session.query(CurrencyCache)
+            .filter(CurrencyCache.base_currency == "GBP")
+            .all()
+        )
+        assert [row.rate for row in cached] == [Decimal("1.19")]
+        assert datetime.utcnow() - cached[0].fetched_at < timedelta(hours=1)
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_returns_errors_per_request(self, currency_service):
+        """Should report a failed fetch without failing the other requests."""
+        respx.get("https://api.frankfurter.app/2025-01-15").mock(
+            return_value=Response(
+                200,
+                json={
+                    "amount": 1.0,
+                    "base": "USD",
+                    "date": "2025-01-15",
+                    "rates": {"EUR": 0.92},
+                },
+            )
+        )
+        respx.get("https://api.frankfurter.app/2025-01-16").mock(
+            return_value=Response(500)
+        )
+
+        rates = await currency_service.get_rates_bulk(
+            [
+                ("USD", "EUR", date(2025, 1, 15)),
+                ("USD", "EUR", date(2025, 1, 16)),
+            ]
+        )
+
+        assert rates["USD", "EUR", date(2025, 1, 15)] == (
+            Decimal("0.92"),
+            date(2025, 1, 15),
+        )
+        assert isinstance(rates["USD", "EUR", date(2025, 1, 16)], CurrencyServiceError)
+
+
 class TestConvert:
     """Tests for convert method."""
 